@@ -2,13 +2,24 @@
 Backlog Propagation Engine
 Simulates how unmet demand accumulates and propagates through time periods
 """
-from typing import List, Dict, Optional, Tuple, Any
-from datetime import date, datetime, timedelta
+from typing import List, Dict, Optional, Tuple, Any, Iterator, Generator
+from dataclasses import dataclass
+from datetime import date, timedelta
 from pydantic import BaseModel, Field
 from enum import Enum
 import random
+import itertools
+import time
 import numpy as np
-from collections import defaultdict
+from collections import Counter
+
+
+# Upper bounds (exclusive) of the snapshot age buckets, in days
+AGE_BUCKET_EDGES = np.array([1, 4, 8, 15])
+AGE_BUCKET_LABELS = ("0-1 days", "1-3 days", "4-7 days", "8-14 days", "15+ days")
+
+# Due-date offset used for items without an SLA deadline
+NO_DUE_DATE = np.iinfo(np.int64).max
 
 
 # ============================================================================
@@ -189,6 +200,59 @@ class BacklogPropagationResponse(BaseModel):
     seed_used: Optional[int]
 
 
+PRIORITY_ORDER = {
+    Priority.LOW: 1,
+    Priority.MEDIUM: 2,
+    Priority.HIGH: 3,
+    Priority.CRITICAL: 4
+}
+
+
+# New-item complexity mix and effort range (minutes) per complexity
+COMPLEXITY_CHOICES = (Complexity.SIMPLE, Complexity.MODERATE, Complexity.COMPLEX)
+COMPLEXITY_WEIGHTS = (0.5, 0.35, 0.15)
+# Precomputed so random.choices skips accumulating the weights on every draw
+COMPLEXITY_CUM_WEIGHTS = tuple(itertools.accumulate(COMPLEXITY_WEIGHTS))
+EFFORT_RANGES = {
+    Complexity.SIMPLE: (15, 30),
+    Complexity.MODERATE: (30, 60),
+    Complexity.COMPLEX: (60, 120)
+}
+
+
+@dataclass
+class BacklogItemsSoA:
+    """Column (structure-of-arrays) view of a backlog for vectorized checks"""
+    priority: np.ndarray  # PRIORITY_ORDER codes
+    effort_min: np.ndarray
+    days_in_backlog: np.ndarray
+    due_offset: np.ndarray  # Days until due date, NO_DUE_DATE when unset
+    sla_breached: np.ndarray
+    
+    @classmethod
+    def from_items(cls, items: List[BacklogItem], current_date: date) -> "BacklogItemsSoA":
+        count = len(items)
+        return cls(
+            priority=np.fromiter(
+                (PRIORITY_ORDER.get(item.priority, 2) for item in items), dtype=np.int8, count=count
+            ),
+            effort_min=np.fromiter(
+                (item.estimated_effort_minutes for item in items), dtype=np.int64, count=count
+            ),
+            days_in_backlog=np.fromiter(
+                (item.days_in_backlog for item in items), dtype=np.int64, count=count
+            ),
+            due_offset=np.fromiter(
+                ((item.due_date - current_date).days if item.due_date else NO_DUE_DATE for item in items),
+                dtype=np.int64,
+                count=count
+            ),
+            sla_breached=np.fromiter(
+                (item.sla_breached for item in items), dtype=bool, count=count
+            )
+        )
+
+
 # ============================================================================
 # Backlog Propagation Engine
 # ============================================================================
@@ -197,29 +261,21 @@ class BacklogPropagationEngine:
     """Core engine for simulating backlog propagation"""
     
     def __init__(self, seed: Optional[int] = None):
-        """Initialize the propagation engine"""
-        if seed is not None:
-            random.seed(seed)
-            np.random.seed(seed)
+        """Initialize the propagation engine
         
-        self.backlog_items: List[BacklogItem] = []
-        self.event_log: List[Dict] = []
-        self.item_counter = 0
+        The engine keeps no per-run state, so one instance can serve
+        concurrent simulations; seed is the default for runs that don't
+        pass their own.
+        """
+        self.seed = seed
     
-    def _generate_item_id(self) -> str:
+    def _generate_item_id(self, item_ids: Iterator[int]) -> str:
         """Generate unique item ID"""
-        self.item_counter += 1
-        return f"ITEM-{self.item_counter:06d}"
+        return f"ITEM-{next(item_ids):06d}"
     
     def _get_priority_order(self, priority: Priority) -> int:
         """Get numeric priority for sorting"""
-        order = {
-            Priority.LOW: 1,
-            Priority.MEDIUM: 2,
-            Priority.HIGH: 3,
-            Priority.CRITICAL: 4
-        }
-        return order.get(priority, 2)
+        return PRIORITY_ORDER.get(priority, 2)
     
     def _upgrade_priority(self, current: Priority) -> Priority:
         """Upgrade to next priority level"""
@@ -283,7 +339,9 @@ class BacklogPropagationEngine:
     def _apply_decay(
         self,
         items: List[BacklogItem],
-        decay_rate: float
+        decay_rate: float,
+        rng: random.Random,
+        event_log: List[Dict]
     ) -> List[BacklogItem]:
         """Apply natural decay to backlog (some items resolve themselves)"""
         if decay_rate <= 0:
@@ -293,7 +351,7 @@ class BacklogPropagationEngine:
         decayed_count = 0
         
         for item in items:
-            if random.random() >= decay_rate:
+            if rng.random() >= decay_rate:
                 remaining_items.append(item)
             else:
                 item.status = ItemStatus.COMPLETED
@@ -301,7 +359,7 @@ class BacklogPropagationEngine:
                 decayed_count += 1
         
         if decayed_count > 0:
-            self.event_log.append({
+            event_log.append({
                 "event": "natural_decay",
                 "count": decayed_count,
                 "rate": decay_rate
@@ -313,41 +371,31 @@ class BacklogPropagationEngine:
         self,
         demand: DailyDemand,
         current_date: date,
-        profile: BacklogPropagationProfile
+        profile: BacklogPropagationProfile,
+        rng: random.Random,
+        item_ids: Iterator[int]
     ) -> List[BacklogItem]:
         """Create new backlog items from demand"""
         new_items = []
         
+        # Calculate SLA deadline (same for every item created today)
+        due_date = None
+        if profile.sla_breach_threshold_days > 0:
+            due_date = current_date + timedelta(days=profile.sla_breach_threshold_days)
+        
         # Generate items by priority
         for priority, count in demand.new_items_by_priority.items():
             for _ in range(count):
                 # Determine complexity (weighted distribution)
-                complexity_weights = {
-                    Complexity.SIMPLE: 0.5,
-                    Complexity.MODERATE: 0.35,
-                    Complexity.COMPLEX: 0.15
-                }
-                complexity = random.choices(
-                    list(complexity_weights.keys()),
-                    weights=list(complexity_weights.values())
-                )[0]
+                complexity = rng.choices(COMPLEXITY_CHOICES, cum_weights=COMPLEXITY_CUM_WEIGHTS)[0]
                 
                 # Estimate effort based on complexity
-                effort_ranges = {
-                    Complexity.SIMPLE: (15, 30),
-                    Complexity.MODERATE: (30, 60),
-                    Complexity.COMPLEX: (60, 120)
-                }
-                effort_min, effort_max = effort_ranges[complexity]
-                effort = random.randint(effort_min, effort_max)
+                effort_min, effort_max = EFFORT_RANGES[complexity]
+                effort = rng.randint(effort_min, effort_max)
                 
-                # Calculate SLA deadline
-                due_date = None
-                if profile.sla_breach_threshold_days > 0:
-                    due_date = current_date + timedelta(days=profile.sla_breach_threshold_days)
-                
-                item = BacklogItem(
-                    id=self._generate_item_id(),
+                # Values are generated here, so skip per-item validation
+                item = BacklogItem.model_construct(
+                    id=self._generate_item_id(item_ids),
                     item_type="work_item",
                     priority=priority,
                     original_priority=priority,
@@ -371,15 +419,11 @@ class BacklogPropagationEngine:
         current_date: date
     ) -> Tuple[List[BacklogItem], int, float]:
         """Resolve items with available capacity"""
-        # Sort by priority (highest first), then age (oldest first)
-        sorted_items = sorted(
-            items,
-            key=lambda x: (
-                -self._get_priority_order(x.priority),
-                x.days_in_backlog
-            ),
-            reverse=True
-        )
+        # Order by priority code, then age (oldest first) - a stable lexsort
+        # equivalent to sorting on (-priority, age) in reverse
+        soa = BacklogItemsSoA.from_items(items, current_date)
+        order = np.lexsort((-soa.days_in_backlog, soa.priority))
+        sorted_items = [items[i] for i in order]
         
         resolved_items = []
         remaining_items = []
@@ -488,14 +532,13 @@ class BacklogPropagationEngine:
         current_date: date
     ) -> int:
         """Check and mark SLA breaches"""
-        breach_count = 0
+        soa = BacklogItemsSoA.from_items(items, current_date)
+        newly_breached = np.flatnonzero((soa.due_offset < 0) & ~soa.sla_breached)
         
-        for item in items:
-            if item.due_date and current_date > item.due_date and not item.sla_breached:
-                item.sla_breached = True
-                breach_count += 1
+        for i in newly_breached:
+            items[i].sla_breached = True
         
-        return breach_count
+        return len(newly_breached)
     
     def _create_snapshot(
         self,
@@ -505,44 +548,44 @@ class BacklogPropagationEngine:
         metrics: Dict
     ) -> BacklogSnapshot:
         """Create snapshot of current backlog state"""
+        count = len(items)
+        
         # Count by priority
-        priority_counts = defaultdict(int)
-        for item in items:
-            priority_counts[item.priority] += 1
+        priority_counts = Counter(item.priority for item in items)
+        
+        # Reduce over column arrays instead of re-walking the item list
+        soa = BacklogItemsSoA.from_items(items, current_date)
+        ages = soa.days_in_backlog
+        efforts = soa.effort_min
+        breached = soa.sla_breached
+        due_offsets = soa.due_offset
         
         # Count by age buckets
-        age_buckets = defaultdict(int)
-        for item in items:
-            if item.days_in_backlog < 1:
-                age_buckets["0-1 days"] += 1
-            elif item.days_in_backlog <= 3:
-                age_buckets["1-3 days"] += 1
-            elif item.days_in_backlog <= 7:
-                age_buckets["4-7 days"] += 1
-            elif item.days_in_backlog <= 14:
-                age_buckets["8-14 days"] += 1
-            else:
-                age_buckets["15+ days"] += 1
+        bucket_counts = np.bincount(
+            np.searchsorted(AGE_BUCKET_EDGES, ages, side="right"),
+            minlength=len(AGE_BUCKET_LABELS)
+        )
+        age_buckets = {
+            label: int(n) for label, n in zip(AGE_BUCKET_LABELS, bucket_counts) if n
+        }
         
         # Calculate metrics
-        total_effort = sum(item.estimated_effort_minutes for item in items) / 60.0
-        avg_age = sum(item.days_in_backlog for item in items) / len(items) if items else 0
-        oldest_age = max((item.days_in_backlog for item in items), default=0)
-        
-        sla_breached = sum(1 for item in items if item.sla_breached)
-        sla_at_risk = sum(
-            1 for item in items 
-            if item.due_date and (item.due_date - current_date).days <= 1 and not item.sla_breached
-        )
-        total_with_sla = sum(1 for item in items if item.due_date is not None)
+        total_effort = int(efforts.sum()) / 60.0
+        total_days_in_backlog = int(ages.sum())
+        avg_age = total_days_in_backlog / count if count else 0
+        oldest_age = int(ages.max()) if count else 0
+        
+        has_due = due_offsets != NO_DUE_DATE
+        sla_breached = int(breached.sum())
+        sla_at_risk = int((has_due & (due_offsets <= 1) & ~breached).sum())
+        total_with_sla = int(has_due.sum())
         sla_compliance = ((total_with_sla - sla_breached) / total_with_sla * 100) if total_with_sla > 0 else 100.0
         
         # Capacity utilization
         max_cap = profile.max_backlog_capacity or 1000
-        capacity_util = (len(items) / max_cap) * 100
+        capacity_util = (count / max_cap) * 100
         
         # Financial impact
-        total_days_in_backlog = sum(item.days_in_backlog for item in items)
         financial_impact = total_days_in_backlog * profile.sla_penalty_per_day
         
         # Customer impact
@@ -552,11 +595,11 @@ class BacklogPropagationEngine:
         daily_capacity = metrics.get('daily_capacity_hours', 40)
         recovery_days = total_effort / (daily_capacity * profile.recovery_rate_multiplier) if daily_capacity > 0 else 0
         
-        return BacklogSnapshot(
+        return BacklogSnapshot.model_construct(
             snapshot_date=current_date,
-            total_items=len(items),
+            total_items=count,
             items_by_priority=dict(priority_counts),
-            items_by_age=dict(age_buckets),
+            items_by_age=age_buckets,
             total_estimated_effort_hours=total_effort,
             avg_age_days=avg_age,
             oldest_item_age_days=oldest_age,
@@ -574,41 +617,55 @@ class BacklogPropagationEngine:
             financial_impact=financial_impact
         )
     
-    def simulate_propagation(
+    def iter_days(
         self,
-        request: BacklogPropagationRequest
-    ) -> BacklogPropagationResponse:
-        """Run backlog propagation simulation"""
-        start_time = datetime.now()
-        
-        # Initialize
-        self.backlog_items = request.initial_backlog_items.copy()
-        self.event_log = []
-        self.item_counter = len(self.backlog_items)
-        
-        daily_snapshots = []
-        current_date = request.start_date
-        
-        # Create lookups for daily inputs
-        capacity_by_date = {cap.date: cap for cap in request.daily_capacities}
-        demand_by_date = {dem.date: dem for dem in request.daily_demands}
+        request: BacklogPropagationRequest,
+        seed: Optional[int] = None
+    ) -> Generator[BacklogSnapshot, None, List[BacklogItem]]:
+        """Simulate day by day, yielding each snapshot as soon as its day is computed
+        
+        The generator's return value is the final list of backlog items.
+        """
+        # Per-run RNG and state keep concurrent runs on one engine independent
+        rng = random.Random(self.seed if seed is None else seed)
+        event_log = []
+        
+        # Initialize - items are mutated as they age, so work on copies and
+        # leave the request's items untouched for callers that share them
+        backlog_items = [item.model_copy() for item in request.initial_backlog_items]
+        item_ids = itertools.count(len(backlog_items) + 1)
+        
+        total_days = (request.end_date - request.start_date).days + 1
+        
+        # Index daily inputs by integer day offset from the start date
+        capacities: List[Optional[DailyCapacity]] = [None] * total_days
+        for cap in request.daily_capacities:
+            offset = (cap.date - request.start_date).days
+            if 0 <= offset < total_days:
+                capacities[offset] = cap
+        demands: List[Optional[DailyDemand]] = [None] * total_days
+        for dem in request.daily_demands:
+            offset = (dem.date - request.start_date).days
+            if 0 <= offset < total_days:
+                demands[offset] = dem
         
         # Simulate each day
-        while current_date <= request.end_date:
+        for day_offset in range(total_days):
             daily_metrics = {}
             
             # Get inputs for today
-            capacity = capacity_by_date.get(current_date)
-            demand = demand_by_date.get(current_date)
+            capacity = capacities[day_offset]
+            demand = demands[day_offset]
             
             if not capacity:
                 # Skip if no capacity defined
-                current_date += timedelta(days=1)
                 continue
             
+            current_date = request.start_date + timedelta(days=day_offset)
+            
             # 1. Age existing items
             aged_count = 0
-            for item in self.backlog_items:
+            for item in backlog_items:
                 item.days_in_backlog += 1
                 if request.enable_priority_aging:
                     if self._apply_aging(item, current_date, request.profile):
@@ -616,26 +673,28 @@ class BacklogPropagationEngine:
             daily_metrics['aged_up'] = aged_count
             
             # 2. Apply natural decay
-            self.backlog_items = self._apply_decay(
-                self.backlog_items,
-                request.profile.decay_rate
+            backlog_items = self._apply_decay(
+                backlog_items,
+                request.profile.decay_rate,
+                rng,
+                event_log
             )
             
             # 3. Process new demand
             new_items = []
             if demand:
-                new_items = self._process_new_items(demand, current_date, request.profile)
-                self.backlog_items.extend(new_items)
+                new_items = self._process_new_items(demand, current_date, request.profile, rng, item_ids)
+                backlog_items.extend(new_items)
             daily_metrics['new_items'] = len(new_items)
             
             # 4. Check SLA breaches
             if request.enable_sla_tracking:
-                breach_count = self._check_sla_breaches(self.backlog_items, current_date)
+                breach_count = self._check_sla_breaches(backlog_items, current_date)
                 daily_metrics['sla_breaches'] = breach_count
             
             # 5. Resolve items with available capacity
-            self.backlog_items, resolved_count, hours_used = self._resolve_items(
-                self.backlog_items,
+            backlog_items, resolved_count, hours_used = self._resolve_items(
+                backlog_items,
                 capacity,
                 current_date
             )
@@ -644,8 +703,8 @@ class BacklogPropagationEngine:
             daily_metrics['daily_capacity_hours'] = capacity.backlog_capacity_hours
             
             # 6. Handle overflow
-            self.backlog_items, overflow_count = self._handle_overflow(
-                self.backlog_items,
+            backlog_items, overflow_count = self._handle_overflow(
+                backlog_items,
                 request.profile.max_backlog_capacity,
                 request.profile.overflow_strategy,
                 current_date
@@ -653,27 +712,32 @@ class BacklogPropagationEngine:
             daily_metrics['overflow_count'] = overflow_count
             
             # 7. Count propagated items (items stillin backlog)
-            propagated_count = len(self.backlog_items)
+            propagated_count = len(backlog_items)
             daily_metrics['propagated'] = propagated_count
             
             # 8. Update propagation counts
-            for item in self.backlog_items:
+            for item in backlog_items:
                 if item.status == ItemStatus.PENDING:
                     item.propagation_count += 1
             
             # 9. Create daily snapshot
             snapshot = self._create_snapshot(
-                self.backlog_items,
+                backlog_items,
                 current_date,
                 request.profile,
                 daily_metrics
             )
-            daily_snapshots.append(snapshot)
-            
-            # Move to next day
-            current_date += timedelta(days=1)
+            yield snapshot
         
-        # Calculate summary statistics
+        return backlog_items
+    
+    def summarize(
+        self,
+        request: BacklogPropagationRequest,
+        daily_snapshots: List[BacklogSnapshot],
+        backlog_items: List[BacklogItem]
+    ) -> Dict[str, Any]:
+        """Summary statistics over a finished run's snapshots and final backlog"""
         total_resolved = sum(s.items_resolved for s in daily_snapshots)
         total_new = sum(s.new_items for s in daily_snapshots)
         avg_backlog = np.mean([s.total_items for s in daily_snapshots])
@@ -683,31 +747,50 @@ class BacklogPropagationEngine:
         avg_recovery_days = np.mean([s.estimated_recovery_days for s in daily_snapshots])
         total_financial_impact = sum(s.financial_impact for s in daily_snapshots)
         
-        summary_stats = {
+        return {
             "total_items_processed": total_resolved,
             "total_new_items": total_new,
-            "net_backlog_change": len(self.backlog_items) - len(request.initial_backlog_items),
+            "net_backlog_change": len(backlog_items) - len(request.initial_backlog_items),
             "avg_daily_backlog": float(avg_backlog),
             "max_daily_backlog": int(max_backlog),
             "avg_sla_compliance_rate": float(avg_sla_compliance),
             "total_sla_breaches": int(total_sla_breaches),
             "avg_recovery_days": float(avg_recovery_days),
             "total_financial_impact": float(total_financial_impact),
-            "final_backlog_size": len(self.backlog_items)
+            "final_backlog_size": len(backlog_items)
         }
+    
+    def simulate_propagation(
+        self,
+        request: BacklogPropagationRequest,
+        seed: Optional[int] = None
+    ) -> BacklogPropagationResponse:
+        """Run backlog propagation simulation"""
+        start_ns = time.perf_counter_ns()
+        
+        daily_snapshots = []
+        days = self.iter_days(request, seed)
+        while True:
+            try:
+                daily_snapshots.append(next(days))
+            except StopIteration as finished:
+                backlog_items = finished.value
+                break
+        
+        summary_stats = self.summarize(request, daily_snapshots, backlog_items)
+        total_days = (request.end_date - request.start_date).days + 1
         
         # Calculate execution time
-        end_time = datetime.now()
-        duration_ms = (end_time - start_time).total_seconds() * 1000
+        duration_ms = (time.perf_counter_ns() - start_ns) / 1e6
         
         return BacklogPropagationResponse(
             organization_id=request.organization_id,
             start_date=request.start_date.isoformat(),
             end_date=request.end_date.isoformat(),
-            total_days=(request.end_date - request.start_date).days + 1,
+            total_days=total_days,
             daily_snapshots=daily_snapshots,
-            final_backlog_items=self.backlog_items,
-            final_backlog_count=len(self.backlog_items),
+            final_backlog_items=backlog_items,
+            final_backlog_count=len(backlog_items),
             summary_stats=summary_stats,
             execution_duration_ms=duration_ms,
             seed_used=request.seed
@@ -2,13 +2,23 @@
 FastAPI Simulation Service
 Workforce scheduling and demand simulation service
 """
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel, Field
-from typing import List, Optional, Dict
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse, Response, StreamingResponse
+from fastapi.routing import APIRoute
+from pydantic import BaseModel, ConfigDict, Field, model_validator
+from typing import Any, Callable, List, Literal, Optional, Dict, Tuple, TypedDict
 from datetime import datetime, date, timedelta
-import random
+from functools import cached_property, lru_cache
+from contextlib import asynccontextmanager
+import asyncio
+import hashlib
+import os
+import time
 from enum import Enum
+import numpy as np
+import orjson
 
 # Import productivity variance engine
 from productivity_variance import (
@@ -21,6 +31,7 @@ from productivity_variance import (
     FactorCategory,
     create_preset_profile,
     create_common_factors,
+    shutdown_process_pool,
 )
 
 # Import backlog propagation engine
@@ -39,11 +50,106 @@ from backlog_propagation import (
     BacklogLevel,
 )
 
+# Stateless between runs, so one engine serves every request (seed is per call)
+_BACKLOG_ENGINE = BacklogPropagationEngine()
+
+def _warmup_engines():
+    """Run tiny simulations so a worker's first real request skips cold-path setup"""
+    day = date.today()
+    ProductivityVarianceEngine().simulate_variance(VarianceSimulationRequest(
+        organization_id="warmup",
+        start_date=day,
+        end_date=day + timedelta(days=2),
+        monte_carlo_runs=2
+    ))
+    _BACKLOG_ENGINE.simulate_propagation(BacklogPropagationRequest(
+        organization_id="warmup",
+        start_date=day,
+        end_date=day,
+        daily_capacities=[DailyCapacity(
+            date=day,
+            total_capacity_hours=8.0,
+            backlog_capacity_hours=4.0,
+            new_work_capacity_hours=4.0
+        )],
+        daily_demands=[DailyDemand(
+            date=day,
+            new_items_by_priority={BacklogPriority.MEDIUM: 2},
+            new_items_by_complexity={Complexity.SIMPLE: 2},
+            total_estimated_effort_hours=1.0
+        )]
+    ))
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    _warmup_engines()
+    yield
+    shutdown_process_pool()
+
+class ORJSONRequest(Request):
+    """Request whose JSON body is parsed with orjson"""
+    
+    async def json(self) -> Any:
+        if not hasattr(self, "_json"):
+            # orjson.JSONDecodeError subclasses json.JSONDecodeError, so FastAPI
+            # still turns malformed bodies into a 422
+            self._json = orjson.loads(await self.body())
+        return self._json
+
+class ORJSONRoute(APIRoute):
+    """Route that hands its endpoint an ORJSONRequest"""
+    
+    def get_route_handler(self) -> Callable:
+        original_route_handler = super().get_route_handler()
+        
+        async def route_handler(request: Request) -> Response:
+            return await original_route_handler(ORJSONRequest(request.scope, request.receive))
+        
+        return route_handler
+
 app = FastAPI(
     title="Workforce Simulation Service",
     description="API for simulating workforce scheduling scenarios and demand forecasting",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
 )
+app.router.route_class = ORJSONRoute
+
+class SimulationErrorMiddleware:
+    """Map uncaught engine errors to a JSON 500 response in one place
+    
+    Handlers registered for bare Exception run outside CORSMiddleware, so their
+    500s would reach browsers without CORS headers; this middleware is added
+    first, which keeps it inside CORS.
+    """
+    
+    def __init__(self, app):
+        self.app = app
+    
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
+        response_started = False
+        
+        async def send_tracking_start(message):
+            nonlocal response_started
+            if message["type"] == "http.response.start":
+                response_started = True
+            await send(message)
+        
+        try:
+            await self.app(scope, receive, send_tracking_start)
+        except Exception as exc:
+            # Too late to change the status once a (streamed) response has begun
+            if response_started:
+                raise
+            response = ORJSONResponse(status_code=500, content={"detail": f"{scope['path']} failed: {exc}"})
+            await response(scope, receive, send)
+
+app.add_middleware(SimulationErrorMiddleware)
 
 # CORS middleware
 app.add_middleware(
@@ -54,6 +160,22 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Simulation responses repeat the same keys on every row and compress well;
+# small bodies such as /health are sent as-is
+app.add_middleware(GZipMiddleware, minimum_size=1024)
+
+def _static_json(payload) -> tuple:
+    """Encode a static payload once and derive its ETag"""
+    body = orjson.dumps(payload)
+    return body, f'"{hashlib.blake2b(body, digest_size=8).hexdigest()}"'
+
+def _etag_response(request: Request, body: bytes, etag: str) -> Response:
+    """Serve a pre-encoded body, answering 304 when the client copy is current"""
+    headers = {"ETag": etag, "Cache-Control": "public, max-age=3600"}
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, headers=headers, media_type="application/json")
+
 # ============================================================================
 # Models
 # ============================================================================
@@ -78,6 +200,9 @@ class SimulationScenario(str, Enum):
     RANDOM_VARIATION = "random_variation"
 
 class DemandSimulationRequest(BaseModel):
+    # Frozen so identical seeded requests can key the response cache
+    model_config = ConfigDict(frozen=True)
+    
     organization_id: str
     start_date: date
     end_date: date
@@ -85,6 +210,18 @@ class DemandSimulationRequest(BaseModel):
     department_id: Optional[str] = None
     base_employees: int = Field(default=10, ge=1, le=1000)
     variance_percentage: float = Field(default=0.2, ge=0, le=1)
+    seed: Optional[int] = None
+    
+    @model_validator(mode="after")
+    def check_date_range(self):
+        if self.end_date < self.start_date:
+            raise ValueError("end_date must be on or after start_date")
+        return self
+    
+    @cached_property
+    def total_days(self) -> int:
+        """Number of days in the simulation window (inclusive)"""
+        return (self.end_date - self.start_date).days + 1
 
 class SimulatedDemand(BaseModel):
     date: str
@@ -123,62 +260,96 @@ class ScheduleOptimizationResponse(BaseModel):
     assignments: List[EmployeeAssignment]
     unmet_demands: List[SimulatedDemand]
 
+class QuickAnalysisDateRange(TypedDict):
+    start: str
+    end: str
+    total_days: int
+
+class QuickAnalysisRange(TypedDict):
+    min: float
+    max: float
+
+class QuickAnalysisProductivity(TypedDict):
+    baseline_units_per_hour: float
+    mean_actual_units_per_hour: float
+    range: QuickAnalysisRange
+
+class QuickAnalysisStaffing(TypedDict):
+    baseline_staff: int
+    avg_additional_staff_needed: float
+    peak_additional_staff_needed: int
+    days_requiring_extra_staff: int
+    total_additional_staff_days: int
+
+class QuickAnalysisRisk(TypedDict):
+    probability_underperformance: str
+    probability_critical: str
+    volatility: float
+
+class QuickAnalysisResponse(TypedDict):
+    scenario: str
+    date_range: QuickAnalysisDateRange
+    productivity_summary: QuickAnalysisProductivity
+    staffing_impact: QuickAnalysisStaffing
+    risk_assessment: QuickAnalysisRisk
+    full_results_available: bool
+
 # ============================================================================
 # Simulation Logic
 # ============================================================================
 
 def generate_demands(request: DemandSimulationRequest) -> List[SimulatedDemand]:
     """Generate simulated demand data based on scenario"""
-    demands = []
-    current_date = request.start_date
+    rng = np.random.default_rng(request.seed)
+    dates = [request.start_date + timedelta(days=i) for i in range(request.total_days)]
     
-    while current_date <= request.end_date:
-        # Determine number of shifts for the day
-        shifts = [ShiftType.MORNING, ShiftType.EVENING]
-        
-        # Scenario-based adjustments
-        if request.scenario == SimulationScenario.HIGH_DEMAND:
-            base = int(request.base_employees * 1.5)
-            shifts.append(ShiftType.NIGHT)
-        elif request.scenario == SimulationScenario.LOW_DEMAND:
-            base = int(request.base_employees * 0.6)
-        elif request.scenario == SimulationScenario.SEASONAL_PEAK:
-            # Simulate seasonal variation (higher on weekends)
-            if current_date.weekday() >= 5:  # Weekend
-                base = int(request.base_employees * 1.8)
-                shifts.append(ShiftType.NIGHT)
-            else:
-                base = request.base_employees
-        else:
-            base = request.base_employees
-        
-        # Generate demand for each shift
-        for shift in shifts:
-            # Add variance
-            variance = random.uniform(-request.variance_percentage, request.variance_percentage)
-            required = max(1, int(base * (1 + variance)))
-            
-            # Determine priority based on required employees
-            if required >= base * 1.3:
-                priority = Priority.HIGH
-            elif required >= base * 1.1:
-                priority = Priority.MEDIUM
-            else:
-                priority = Priority.LOW
-            
-            demand = SimulatedDemand(
-                date=current_date.isoformat(),
-                shift_type=shift,
-                required_employees=required,
-                priority=priority,
-                department_id=request.department_id,
-                notes=f"Simulated {request.scenario.value} scenario"
-            )
-            demands.append(demand)
-        
-        current_date += timedelta(days=1)
+    # Scenario-based base staffing and night-shift flag per day
+    base = np.full(len(dates), request.base_employees, dtype=np.int64)
+    night = np.zeros(len(dates), dtype=bool)
+    if request.scenario == SimulationScenario.HIGH_DEMAND:
+        base[:] = int(request.base_employees * 1.5)
+        night[:] = True
+    elif request.scenario == SimulationScenario.LOW_DEMAND:
+        base[:] = int(request.base_employees * 0.6)
+    elif request.scenario == SimulationScenario.SEASONAL_PEAK:
+        # Simulate seasonal variation (higher on weekends)
+        weekend = np.fromiter((d.weekday() >= 5 for d in dates), dtype=bool, count=len(dates))
+        base[weekend] = int(request.base_employees * 1.8)
+        night[weekend] = True
+    
+    # One row per (day, shift): morning and evening every day, plus night where flagged
+    day_idx = np.repeat(np.arange(len(dates)), 2 + night)
+    shift_base = base[day_idx]
+    
+    # Add variance
+    variance = rng.uniform(-request.variance_percentage, request.variance_percentage, size=len(day_idx))
+    required = np.maximum(1, (shift_base * (1 + variance)).astype(np.int64))
     
-    return demands
+    # Determine priority based on required employees
+    priority_idx = np.select(
+        [required >= shift_base * 1.3, required >= shift_base * 1.1], [2, 1], default=0
+    )
+    
+    priorities = (Priority.LOW, Priority.MEDIUM, Priority.HIGH)
+    shifts = (ShiftType.MORNING, ShiftType.EVENING, ShiftType.NIGHT)
+    date_strings = [d.isoformat() for d in dates]
+    notes = f"Simulated {request.scenario.value} scenario"
+    
+    # Shift slot within each day: 0, 1 (, 2) - offset from the day's first row
+    day_starts = np.concatenate(([0], np.cumsum(2 + night)[:-1]))
+    slot = np.arange(len(day_idx)) - day_starts[day_idx]
+    
+    return [
+        SimulatedDemand.model_construct(
+            date=date_strings[d],
+            shift_type=shifts[k],
+            required_employees=r,
+            priority=priorities[p],
+            department_id=request.department_id,
+            notes=notes
+        )
+        for d, k, r, p in zip(day_idx.tolist(), slot.tolist(), required.tolist(), priority_idx.tolist())
+    ]
 
 def optimize_schedule(request: ScheduleOptimizationRequest) -> ScheduleOptimizationResponse:
     """Simulate schedule optimization"""
@@ -187,47 +358,49 @@ def optimize_schedule(request: ScheduleOptimizationRequest) -> ScheduleOptimizat
     
     # Simple greedy allocation
     total_required = sum(d.required_employees for d in request.demands)
-    employees_needed = min(request.available_employees, total_required)
+    employees_needed = max(0, min(request.available_employees, total_required))
     
-    # Simulate assignments
-    employee_hours = {}
+    # Hours worked per employee, indexed by employee number; keys are
+    # formatted once up front and only used for assignment records
+    emp_keys = [f"EMP-{emp_id:04d}" for emp_id in range(employees_needed)]
+    employee_hours = np.zeros(employees_needed, dtype=np.float32)
     covered_demands = 0
     total_shifts = 0
     
-    for idx, demand in enumerate(request.demands):
-        # Simulate 8-hour shifts
-        shift_hours = 8.0
-        employees_assigned = 0
+    # Simulate 8-hour shifts
+    shift_hours = 8.0
+    
+    for demand in request.demands:
+        # Lowest-numbered employees with room for another shift take it; at
+        # least one is always tried, matching the original greedy scan
+        eligible = np.flatnonzero(employee_hours + shift_hours <= request.max_hours_per_employee)
+        take = eligible[:max(demand.required_employees, 1)]
+        employee_hours[take] += shift_hours
         
-        for emp_id in range(employees_needed):
-            emp_key = f"EMP-{emp_id:04d}"
-            current_hours = employee_hours.get(emp_key, 0)
-            
-            if current_hours + shift_hours <= request.max_hours_per_employee:
-                assignments.append(EmployeeAssignment(
-                    employee_id=emp_key,
-                    shift_date=demand.date,
-                    shift_type=demand.shift_type,
-                    hours=shift_hours,
-                    department_id=demand.department_id
-                ))
-                employee_hours[emp_key] = current_hours + shift_hours
-                employees_assigned += 1
-                total_shifts += 1
-                
-                if employees_assigned >= demand.required_employees:
-                    covered_demands += 1
-                    break
+        assignments.extend(
+            EmployeeAssignment.model_construct(
+                employee_id=emp_keys[emp_id],
+                shift_date=demand.date,
+                shift_type=demand.shift_type,
+                hours=shift_hours,
+                department_id=demand.department_id
+            )
+            for emp_id in take.tolist()
+        )
+        employees_assigned = len(take)
+        total_shifts += employees_assigned
         
+        if employees_assigned and employees_assigned >= demand.required_employees:
+            covered_demands += 1
         if employees_assigned < demand.required_employees:
             unmet_demands.append(demand)
     
     coverage = (covered_demands / len(request.demands)) * 100 if request.demands else 0
-    total_hours = sum(employee_hours.values())
+    total_hours = float(employee_hours.sum())
     
     return ScheduleOptimizationResponse(
         total_shifts=total_shifts,
-        employees_utilized=len(employee_hours),
+        employees_utilized=int((employee_hours > 0).sum()),
         coverage_percentage=round(coverage, 2),
         total_hours=round(total_hours, 2),
         assignments=assignments,
@@ -238,24 +411,59 @@ def optimize_schedule(request: ScheduleOptimizationRequest) -> ScheduleOptimizat
 # Routes
 # ============================================================================
 
+# Health payloads only change per worker, so they carry the startup time
+# and are encoded once instead of on every load balancer probe
+_STARTED_AT = datetime.now().isoformat()
+
+_ROOT_BODY = orjson.dumps({
+    "service": "Workforce Simulation Service",
+    "status": "healthy",
+    "version": "1.0.0",
+    "timestamp": _STARTED_AT
+})
+
+_HEALTH_BODY = orjson.dumps({
+    "status": "healthy",
+    "timestamp": _STARTED_AT,
+    "uptime": "operational"
+})
+
 @app.get("/")
 async def root():
     """Health check endpoint"""
-    return {
-        "service": "Workforce Simulation Service",
-        "status": "healthy",
-        "version": "1.0.0",
-        "timestamp": datetime.now().isoformat()
-    }
+    return Response(content=_ROOT_BODY, media_type="application/json")
 
 @app.get("/health")
 async def health_check():
     """Detailed health check"""
-    return {
-        "status": "healthy",
-        "timestamp": datetime.now().isoformat(),
-        "uptime": "operational"
-    }
+    return Response(content=_HEALTH_BODY, media_type="application/json")
+
+def _summarize_demand(required: np.ndarray, total_days: int) -> Tuple[int, float]:
+    """Total and per-day average of required employees"""
+    total = required.sum()
+    return int(total), float(np.round(total / total_days, 2))
+
+def _build_demand_response(request: DemandSimulationRequest) -> DemandSimulationResponse:
+    """Run demand generation and summarize the results"""
+    demands = generate_demands(request)
+    required = np.fromiter(
+        (d.required_employees for d in demands), dtype=np.int64, count=len(demands)
+    )
+    total_employees, average_per_day = _summarize_demand(required, request.total_days)
+    
+    return DemandSimulationResponse(
+        organization_id=request.organization_id,
+        scenario=request.scenario.value,
+        total_demands=len(demands),
+        total_employees_needed=total_employees,
+        average_per_day=average_per_day,
+        demands=demands
+    )
+
+@lru_cache(maxsize=256)
+def _cached_demand_body(request: DemandSimulationRequest) -> bytes:
+    """Seeded demand generation is deterministic, so keep the encoded body"""
+    return _build_demand_response(request).model_dump_json().encode()
 
 @app.post("/sim/demand/generate", response_model=DemandSimulationResponse)
 async def simulate_demand(request: DemandSimulationRequest):
@@ -268,22 +476,13 @@ async def simulate_demand(request: DemandSimulationRequest):
     - low_demand: 40% decrease in requirements
     - seasonal_peak: Weekend surge patterns
     - random_variation: Random daily fluctuations
+    
+    Requests with a seed are reproducible and served from an in-memory cache
     """
-    try:
-        demands = generate_demands(request)
-        total_employees = sum(d.required_employees for d in demands)
-        days = (request.end_date - request.start_date).days + 1
-        
-        return DemandSimulationResponse(
-            organization_id=request.organization_id,
-            scenario=request.scenario.value,
-            total_demands=len(demands),
-            total_employees_needed=total_employees,
-            average_per_day=round(total_employees / days, 2) if days > 0 else 0,
-            demands=demands
-        )
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Simulation failed: {str(e)}")
+    if request.seed is not None:
+        return Response(content=_cached_demand_body(request), media_type="application/json")
+    
+    return _build_demand_response(request)
 
 @app.post("/sim/schedule/optimize", response_model=ScheduleOptimizationResponse)
 async def optimize_schedule_endpoint(request: ScheduleOptimizationRequest):
@@ -293,39 +492,39 @@ async def optimize_schedule_endpoint(request: ScheduleOptimizationRequest):
     Uses greedy allocation algorithm to assign employees to shifts
     while respecting hour constraints
     """
-    try:
-        result = optimize_schedule(request)
-        return result
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Optimization failed: {str(e)}")
+    result = optimize_schedule(request)
+    return result
+
+# Scenario catalog is static, so the response body and ETag are computed once at import time
+_SCENARIOS_BODY, _SCENARIOS_ETAG = _static_json({
+    "scenarios": [
+        {
+            "name": "baseline",
+            "description": "Normal demand patterns with specified variance"
+        },
+        {
+            "name": "high_demand",
+            "description": "50% increase in demand, includes night shifts"
+        },
+        {
+            "name": "low_demand",
+            "description": "40% decrease in demand"
+        },
+        {
+            "name": "seasonal_peak",
+            "description": "80% increase on weekends, normal on weekdays"
+        },
+        {
+            "name": "random_variation",
+            "description": "Random daily fluctuations within variance range"
+        }
+    ]
+})
 
 @app.get("/sim/scenarios")
-async def list_scenarios():
+async def list_scenarios(request: Request):
     """List available simulation scenarios"""
-    return {
-        "scenarios": [
-            {
-                "name": "baseline",
-                "description": "Normal demand patterns with specified variance"
-            },
-            {
-                "name": "high_demand",
-                "description": "50% increase in demand, includes night shifts"
-            },
-            {
-                "name": "low_demand",
-                "description": "40% decrease in demand"
-            },
-            {
-                "name": "seasonal_peak",
-                "description": "80% increase on weekends, normal on weekdays"
-            },
-            {
-                "name": "random_variation",
-                "description": "Random daily fluctuations within variance range"
-            }
-        ]
-    }
+    return _etag_response(request, _SCENARIOS_BODY, _SCENARIOS_ETAG)
 
 # ============================================================================
 # Productivity Variance Endpoints
@@ -345,91 +544,81 @@ async def simulate_productivity_variance(request: VarianceSimulationRequest):
     
     Returns detailed productivity metrics and staffing impact analysis
     """
-    try:
-        engine = ProductivityVarianceEngine(seed=request.seed)
-        result = engine.simulate_variance(request)
-        return result
-    except Exception as e:
-        raise HTTPException(
-            status_code=500,
-            detail=f"Productivity variance simulation failed: {str(e)}"
-        )
+    engine = ProductivityVarianceEngine(seed=request.seed)
+    # CPU-bound (and possibly waiting on the process pool): keep it off the event loop
+    result = await asyncio.to_thread(engine.simulate_variance, request)
+    
+    # Encode once into a contiguous body; Response sets an exact Content-Length
+    return Response(content=result.model_dump_json(), media_type="application/json")
+
+# Presets are static, so the response body and ETag are computed once at import time
+_PRESETS_BODY, _PRESETS_ETAG = _static_json({
+    "presets": [
+        {
+            "scenario": "consistent",
+            "name": "Consistent Performance",
+            "description": "Low variance, predictable productivity (±5%)",
+            "profile": create_preset_profile(VarianceScenario.CONSISTENT).model_dump(mode="json")
+        },
+        {
+            "scenario": "volatile",
+            "name": "Volatile Performance",
+            "description": "High variance, unpredictable swings (±25%)",
+            "profile": create_preset_profile(VarianceScenario.VOLATILE).model_dump(mode="json")
+        },
+        {
+            "scenario": "declining",
+            "name": "Declining Performance",
+            "description": "Gradual 30% decline over time period",
+            "profile": create_preset_profile(VarianceScenario.DECLINING).model_dump(mode="json")
+        },
+        {
+            "scenario": "improving",
+            "name": "Improving Performance",
+            "description": "Learning curve with gradual improvement",
+            "profile": create_preset_profile(VarianceScenario.IMPROVING).model_dump(mode="json")
+        },
+        {
+            "scenario": "cyclical",
+            "name": "Cyclical Performance",
+            "description": "Weekly patterns (better mid-week, worse weekends)",
+            "profile": create_preset_profile(VarianceScenario.CYCLICAL).model_dump(mode="json")
+        },
+        {
+            "scenario": "shock",
+            "name": "Shock Events",
+            "description": "Random disruption events (10% daily chance)",
+            "profile": create_preset_profile(VarianceScenario.SHOCK).model_dump(mode="json")
+        },
+    ]
+})
 
 @app.get("/sim/productivity/presets")
-async def get_variance_presets():
+async def get_variance_presets(request: Request):
     """Get preset productivity variance profiles"""
-    return {
-        "presets": [
-            {
-                "scenario": "consistent",
-                "name": "Consistent Performance",
-                "description": "Low variance, predictable productivity (±5%)",
-                "profile": create_preset_profile(VarianceScenario.CONSISTENT).dict()
-            },
-            {
-                "scenario": "volatile",
-                "name": "Volatile Performance",
-                "description": "High variance, unpredictable swings (±25%)",
-                "profile": create_preset_profile(VarianceScenario.VOLATILE).dict()
-            },
-            {
-                "scenario": "declining",
-                "name": "Declining Performance",
-                "description": "Gradual 30% decline over time period",
-                "profile": create_preset_profile(VarianceScenario.DECLINING).dict()
-            },
-            {
-                "scenario": "improving",
-                "name": "Improving Performance",
-                "description": "Learning curve with gradual improvement",
-                "profile": create_preset_profile(VarianceScenario.IMPROVING).dict()
-            },
-            {
-                "scenario": "cyclical",
-                "name": "Cyclical Performance",
-                "description": "Weekly patterns (better mid-week, worse weekends)",
-                "profile": create_preset_profile(VarianceScenario.CYCLICAL).dict()
-            },
-            {
-                "scenario": "shock",
-                "name": "Shock Events",
-                "description": "Random disruption events (10% daily chance)",
-                "profile": create_preset_profile(VarianceScenario.SHOCK).dict()
-            },
-        ]
-    }
+    return _etag_response(request, _PRESETS_BODY, _PRESETS_ETAG)
+
+# Common factors are static, so the response body is built once at import time
+_FACTORS_BODY, _FACTORS_ETAG = _static_json({
+    "factors": [
+        {
+            "name": f.name,
+            "category": f.category.value,
+            "impact_magnitude": f.impact_magnitude,
+            "impact_percentage": f"{f.impact_magnitude * 100:+.0f}%",
+            "probability": f.probability,
+            "duration_hours": f.duration_hours,
+            "description": f.description
+        }
+        for f in create_common_factors()
+    ],
+    "categories": [c.value for c in FactorCategory]
+})
 
 @app.get("/sim/productivity/factors")
-async def get_common_factors():
+async def get_common_factors(request: Request):
     """Get common productivity variance factors"""
-    factors = create_common_factors()
-    return {
-        "factors": [
-            {
-                "name": f.name,
-                "category": f.category.value,
-                "impact_magnitude": f.impact_magnitude,
-                "impact_percentage": f"{f.impact_magnitude * 100:+.0f}%",
-                "probability": f.probability,
-                "duration_hours": f.duration_hours,
-                "description": _get_factor_description(f)
-            }
-            for f in factors
-        ],
-        "categories": [c.value for c in FactorCategory]
-    }
-
-def _get_factor_description(factor: ProductivityVarianceFactor) -> str:
-    """Generate description for a variance factor"""
-    impact_dir = "decreases" if factor.impact_magnitude < 0 else "increases"
-    impact_pct = abs(factor.impact_magnitude * 100)
-    prob_pct = factor.probability * 100
-    
-    return (
-        f"{factor.category.value.title()} factor that {impact_dir} productivity by "
-        f"{impact_pct:.0f}%. Occurs {prob_pct:.0f}% of the time for approximately "
-        f"{factor.duration_hours} hours."
-    )
+    return _etag_response(request, _FACTORS_BODY, _FACTORS_ETAG)
 
 @app.post("/sim/productivity/quick-analysis")
 async def quick_productivity_analysis(
@@ -445,58 +634,57 @@ async def quick_productivity_analysis(
     
     Simplified endpoint for rapid what-if analysis using preset profiles
     """
-    try:
-        profile = create_preset_profile(scenario)
-        
-        request = VarianceSimulationRequest(
-            organization_id=organization_id,
-            start_date=start_date,
-            end_date=end_date,
-            variance_scenario=scenario,
-            profile=profile,
-            baseline_units_per_hour=baseline_units_per_hour,
-            baseline_staff_needed=baseline_staff,
-            monte_carlo_runs=1
-        )
-        
-        engine = ProductivityVarianceEngine()
-        result = engine.simulate_variance(request)
-        
-        # Return simplified summary
-        return {
-            "scenario": scenario.value,
-            "date_range": {
-                "start": start_date.isoformat(),
-                "end": end_date.isoformat(),
-                "total_days": result.total_days
-            },
-            "productivity_summary": {
-                "baseline_units_per_hour": baseline_units_per_hour,
-                "mean_actual_units_per_hour": baseline_units_per_hour * result.productivity_stats["mean"],
-                "range": {
-                    "min": baseline_units_per_hour * result.productivity_stats["min"],
-                    "max": baseline_units_per_hour * result.productivity_stats["max"]
-                }
-            },
-            "staffing_impact": {
-                "baseline_staff": baseline_staff,
-                "avg_additional_staff_needed": result.staffing_impact["avg_variance"],
-                "peak_additional_staff_needed": result.staffing_impact["max_additional_staff"],
-                "days_requiring_extra_staff": result.staffing_impact["days_understaffed"],
-                "total_additional_staff_days": result.staffing_impact["total_additional_staff_days"]
-            },
-            "risk_assessment": {
-                "probability_underperformance": f"{result.risk_metrics['probability_below_90pct'] * 100:.1f}%",
-                "probability_critical": f"{result.risk_metrics['probability_below_80pct'] * 100:.1f}%",
-                "volatility": result.risk_metrics["volatility"]
-            },
-            "full_results_available": True
-        }
-    except Exception as e:
-        raise HTTPException(
-            status_code=500,
-            detail=f"Quick analysis failed: {str(e)}"
-        )
+    profile = create_preset_profile(scenario)
+    
+    request = VarianceSimulationRequest(
+        organization_id=organization_id,
+        start_date=start_date,
+        end_date=end_date,
+        variance_scenario=scenario,
+        profile=profile,
+        baseline_units_per_hour=baseline_units_per_hour,
+        baseline_staff_needed=baseline_staff,
+        monte_carlo_runs=1
+    )
+    
+    engine = ProductivityVarianceEngine()
+    result = await asyncio.to_thread(engine.simulate_variance, request)
+    
+    stats = result.productivity_stats
+    staffing = result.staffing_impact
+    risk = result.risk_metrics
+    
+    # Return simplified summary, encoded directly with orjson
+    summary: QuickAnalysisResponse = {
+        "scenario": scenario.value,
+        "date_range": {
+            "start": start_date.isoformat(),
+            "end": end_date.isoformat(),
+            "total_days": result.total_days
+        },
+        "productivity_summary": {
+            "baseline_units_per_hour": baseline_units_per_hour,
+            "mean_actual_units_per_hour": baseline_units_per_hour * stats["mean"],
+            "range": {
+                "min": baseline_units_per_hour * stats["min"],
+                "max": baseline_units_per_hour * stats["max"]
+            }
+        },
+        "staffing_impact": {
+            "baseline_staff": baseline_staff,
+            "avg_additional_staff_needed": staffing["avg_variance"],
+            "peak_additional_staff_needed": staffing["max_additional_staff"],
+            "days_requiring_extra_staff": staffing["days_understaffed"],
+            "total_additional_staff_days": staffing["total_additional_staff_days"]
+        },
+        "risk_assessment": {
+            "probability_underperformance": f"{risk['probability_below_90pct'] * 100:.1f}%",
+            "probability_critical": f"{risk['probability_below_80pct'] * 100:.1f}%",
+            "volatility": risk["volatility"]
+        },
+        "full_results_available": True
+    }
+    return Response(content=orjson.dumps(summary), media_type="application/json")
 
 
 # ============================================================================
@@ -511,15 +699,336 @@ async def run_backlog_propagation(request: BacklogPropagationRequest):
     Simulates how unmet demand accumulates and propagates through time periods,
     modeling overflow, SLA breaches, priority aging, and capacity constraints.
     """
-    try:
-        engine = BacklogPropagationEngine(seed=request.seed)
-        result = engine.simulate_propagation(request)
-        return result
-    except Exception as e:
-        raise HTTPException(
-            status_code=500,
-            detail=f"Backlog propagation simulation failed: {str(e)}"
+    result = _BACKLOG_ENGINE.simulate_propagation(request, seed=request.seed)
+    
+    # Engine output is already a validated model; serialize it directly rather
+    # than letting response_model (kept for the OpenAPI schema) re-validate it
+    return Response(content=result.model_dump_json(), media_type="application/json")
+
+
+@app.post("/sim/backlog/propagate/stream")
+async def stream_backlog_propagation(request: BacklogPropagationRequest, http_request: Request):
+    """
+    Run backlog propagation simulation and stream the result as NDJSON
+
+    Emits one JSON record per line: a "header" record, one "day" record per
+    daily snapshot, one "item" record per final backlog item, and a closing
+    "summary" record. Days are simulated and sent one at a time, so clients
+    can parse long simulations while the server is still computing them.
+    If the simulation fails part-way, the stream ends with an "error" record
+    instead of the summary.
+    """
+    path = http_request.url.path
+
+    def ndjson_lines():
+        # A plain generator: StreamingResponse advances it on a worker thread, so
+        # each day is simulated off the event loop and sent as soon as it is done
+        start_ns = time.perf_counter_ns()
+        yield orjson.dumps({
+            "type": "header",
+            "organization_id": request.organization_id,
+            "start_date": request.start_date.isoformat(),
+            "end_date": request.end_date.isoformat(),
+            "total_days": (request.end_date - request.start_date).days + 1
+        }) + b"\n"
+        try:
+            daily_snapshots = []
+            days = _BACKLOG_ENGINE.iter_days(request, request.seed)
+            while True:
+                try:
+                    snapshot = next(days)
+                except StopIteration as finished:
+                    backlog_items = finished.value
+                    break
+                daily_snapshots.append(snapshot)
+                yield b'{"type":"day",' + snapshot.model_dump_json().encode()[1:] + b"\n"
+            for item in backlog_items:
+                yield b'{"type":"item",' + item.model_dump_json().encode()[1:] + b"\n"
+            summary_stats = _BACKLOG_ENGINE.summarize(request, daily_snapshots, backlog_items)
+        except Exception as exc:
+            # The 200 status has already been sent; end with an explicit error record
+            yield orjson.dumps({"type": "error", "detail": f"{path} failed: {exc}"}) + b"\n"
+            return
+        yield orjson.dumps({
+            "type": "summary",
+            "final_backlog_count": len(backlog_items),
+            "summary_stats": summary_stats,
+            "execution_duration_ms": (time.perf_counter_ns() - start_ns) / 1e6,
+            "seed_used": request.seed
+        }) + b"\n"
+
+    return StreamingResponse(ndjson_lines(), media_type="application/x-ndjson")
+
+
+# Initial backlog mix for quick scenarios, indexed by batched NumPy draws
+INITIAL_PRIORITIES = (BacklogPriority.LOW, BacklogPriority.MEDIUM, BacklogPriority.HIGH, BacklogPriority.CRITICAL)
+INITIAL_PRIORITY_WEIGHTS = (0.3, 0.35, 0.25, 0.1)
+INITIAL_COMPLEXITIES = (Complexity.SIMPLE, Complexity.MODERATE, Complexity.COMPLEX)
+
+def _quick_scenario_requests(
+    organization_id: str,
+    start_date: date,
+    days: int,
+    daily_demand_count: int,
+    daily_capacity_hours: float,
+    initial_backlog_count: int
+) -> Dict[str, BacklogPropagationRequest]:
+    """Build the four preset quick-scenario requests, keyed by scenario name"""
+    end_date = start_date + timedelta(days=days - 1)
+    
+    # Every day in a scenario shares the same inputs, so build the dates and
+    # count dicts once and skip per-day validation with model_construct
+    dates = [start_date + timedelta(days=day_offset) for day_offset in range(days)]
+    
+    # Generate daily capacities
+    daily_capacities = [
+        DailyCapacity.model_construct(
+            date=day,
+            total_capacity_hours=daily_capacity_hours,
+            backlog_capacity_hours=daily_capacity_hours * 0.6,
+            new_work_capacity_hours=daily_capacity_hours * 0.4,
+            staff_count=10,
+            productivity_modifier=1.0,
+            max_items_per_day=100,
+            max_complex_items_per_day=10
         )
+        for day in dates
+    ]
+    
+    # Generate daily demands
+    standard_by_complexity = {
+        Complexity.SIMPLE: int(daily_demand_count * 0.5),
+        Complexity.MODERATE: int(daily_demand_count * 0.35),
+        Complexity.COMPLEX: int(daily_demand_count * 0.15)
+    }
+    balanced_by_priority = {
+        BacklogPriority.LOW: int(daily_demand_count * 0.4),
+        BacklogPriority.MEDIUM: int(daily_demand_count * 0.3),
+        BacklogPriority.HIGH: int(daily_demand_count * 0.2),
+        BacklogPriority.CRITICAL: int(daily_demand_count * 0.1)
+    }
+    daily_demands = [
+        DailyDemand.model_construct(
+            date=day,
+            new_items_by_priority=balanced_by_priority,
+            new_items_by_complexity=standard_by_complexity,
+            total_estimated_effort_hours=daily_demand_count * 0.5
+        )
+        for day in dates
+    ]
+    
+    # Generate initial backlog if specified
+    # Draw every item attribute in one batch rather than per item
+    rng = np.random.default_rng(42)
+    priority_idx = rng.choice(len(INITIAL_PRIORITIES), size=initial_backlog_count, p=INITIAL_PRIORITY_WEIGHTS).tolist()
+    complexity_idx = rng.integers(0, len(INITIAL_COMPLEXITIES), size=initial_backlog_count).tolist()
+    efforts = rng.integers(30, 91, size=initial_backlog_count).tolist()
+    # Items have been in backlog 1-5 days
+    days_old = rng.integers(1, 6, size=initial_backlog_count).tolist()
+    due_date = start_date + timedelta(days=1)
+    
+    initial_items = [
+        BacklogItem.model_construct(
+            id=f"INITIAL-{i+1:04d}",
+            item_type="work_item",
+            priority=INITIAL_PRIORITIES[priority_idx[i]],
+            original_priority=INITIAL_PRIORITIES[priority_idx[i]],
+            complexity=INITIAL_COMPLEXITIES[complexity_idx[i]],
+            estimated_effort_minutes=efforts[i],
+            created_date=start_date - timedelta(days=days_old[i]),
+            due_date=due_date,
+            status=ItemStatus.PENDING,
+            days_in_backlog=days_old[i],
+            propagation_count=days_old[i]
+        )
+        for i in range(initial_backlog_count)
+    ]
+    
+    # Scenario 1: Balanced
+    balanced_profile = BacklogPropagationProfile(
+        propagation_rate=1.0,
+        decay_rate=0.05,
+        max_backlog_capacity=500,
+        aging_enabled=True,
+        aging_threshold_days=3,
+        overflow_strategy=OverflowStrategy.DEFER,
+        sla_breach_threshold_days=2,
+        sla_penalty_per_day=100.0,
+        recovery_rate_multiplier=1.0
+    )
+    
+    balanced_request = BacklogPropagationRequest(
+        organization_id=organization_id,
+        start_date=start_date,
+        end_date=end_date,
+        profile=balanced_profile,
+        initial_backlog_items=initial_items,
+        daily_capacities=daily_capacities,
+        daily_demands=daily_demands,
+        seed=42
+    )
+    
+    # Scenario 2: Overflow
+    overflow_profile = BacklogPropagationProfile(
+        propagation_rate=1.0,
+        decay_rate=0.02,
+        max_backlog_capacity=200,
+        aging_enabled=True,
+        aging_threshold_days=2,
+        overflow_strategy=OverflowStrategy.REJECT,
+        sla_breach_threshold_days=1,
+        sla_penalty_per_day=150.0,
+        recovery_rate_multiplier=1.0
+    )
+    
+    # Increase demand for overflow
+    overflow_by_priority = {
+        BacklogPriority.LOW: int(daily_demand_count * 0.6),
+        BacklogPriority.MEDIUM: int(daily_demand_count * 0.5),
+        BacklogPriority.HIGH: int(daily_demand_count * 0.3),
+        BacklogPriority.CRITICAL: int(daily_demand_count * 0.15)
+    }
+    overflow_demands = [
+        DailyDemand.model_construct(
+            date=day,
+            new_items_by_priority=overflow_by_priority,
+            new_items_by_complexity=standard_by_complexity,
+            total_estimated_effort_hours=daily_demand_count * 0.75
+        )
+        for day in dates
+    ]
+    
+    overflow_request = BacklogPropagationRequest(
+        organization_id=organization_id,
+        start_date=start_date,
+        end_date=end_date,
+        profile=overflow_profile,
+        initial_backlog_items=initial_items,
+        daily_capacities=daily_capacities,
+        daily_demands=overflow_demands,
+        seed=43
+    )
+    
+    # Scenario 3: Recovery
+    recovery_profile = BacklogPropagationProfile(
+        propagation_rate=1.0,
+        decay_rate=0.10,
+        max_backlog_capacity=500,
+        aging_enabled=False,  # Focus on clearing, not aging
+        aging_threshold_days=5,
+        overflow_strategy=OverflowStrategy.DEFER,
+        sla_breach_threshold_days=3,
+        sla_penalty_per_day=100.0,
+        recovery_rate_multiplier=1.50  # 50% recovery boost
+    )
+    
+    # Recovery capacities with boost
+    recovery_capacities = [
+        DailyCapacity.model_construct(
+            date=day,
+            total_capacity_hours=daily_capacity_hours * 1.3,
+            backlog_capacity_hours=daily_capacity_hours * 0.9,  # 90% to backlog
+            new_work_capacity_hours=daily_capacity_hours * 0.4,
+            staff_count=13,
+            productivity_modifier=1.2,  # 20% productivity boost
+            max_items_per_day=130,
+            max_complex_items_per_day=15
+        )
+        for day in dates
+    ]
+    
+    # Reduce demand during recovery
+    recovery_by_priority = {
+        BacklogPriority.LOW: int(daily_demand_count * 0.2),
+        BacklogPriority.MEDIUM: int(daily_demand_count * 0.15),
+        BacklogPriority.HIGH: int(daily_demand_count * 0.10),
+        BacklogPriority.CRITICAL: int(daily_demand_count * 0.05)
+    }
+    recovery_by_complexity = {
+        Complexity.SIMPLE: int(daily_demand_count * 0.3),
+        Complexity.MODERATE: int(daily_demand_count * 0.15),
+        Complexity.COMPLEX: int(daily_demand_count * 0.05)
+    }
+    recovery_demands = [
+        DailyDemand.model_construct(
+            date=day,
+            new_items_by_priority=recovery_by_priority,
+            new_items_by_complexity=recovery_by_complexity,
+            total_estimated_effort_hours=daily_demand_count * 0.25
+        )
+        for day in dates
+    ]
+    
+    recovery_request = BacklogPropagationRequest(
+        organization_id=organization_id,
+        start_date=start_date,
+        end_date=end_date,
+        profile=recovery_profile,
+        initial_backlog_items=initial_items,
+        daily_capacities=recovery_capacities,
+        daily_demands=recovery_demands,
+        seed=44
+    )
+    
+    # Scenario 4: High Priority Aging
+    aging_profile = BacklogPropagationProfile(
+        propagation_rate=1.0,
+        decay_rate=0.03,
+        max_backlog_capacity=500,
+        aging_enabled=True,
+        aging_threshold_days=1,  # Rapid aging
+        overflow_strategy=OverflowStrategy.ESCALATE,
+        sla_breach_threshold_days=1,
+        sla_penalty_per_day=200.0,
+        recovery_rate_multiplier=1.0
+    )
+    
+    aging_request = BacklogPropagationRequest(
+        organization_id=organization_id,
+        start_date=start_date,
+        end_date=end_date,
+        profile=aging_profile,
+        initial_backlog_items=initial_items,
+        daily_capacities=daily_capacities,
+        daily_demands=daily_demands,
+        seed=45
+    )
+    
+    return {
+        "balanced": balanced_request,
+        "overflow": overflow_request,
+        "recovery": recovery_request,
+        "high_priority_aging": aging_request
+    }
+
+
+def _quick_scenarios_header(
+    organization_id: str,
+    start_date: date,
+    days: int,
+    daily_demand_count: int,
+    daily_capacity_hours: float,
+    initial_backlog_count: int
+) -> Dict:
+    """Request echo shared by the quick-scenarios document and stream"""
+    return {
+        "organization_id": organization_id,
+        "simulation_period": {
+            "start_date": start_date.isoformat(),
+            "end_date": (start_date + timedelta(days=days - 1)).isoformat(),
+            "total_days": days
+        },
+        "input_parameters": {
+            "daily_demand_count": daily_demand_count,
+            "daily_capacity_hours": daily_capacity_hours,
+            "initial_backlog_count": initial_backlog_count
+        }
+    }
+
+
+async def _run_quick_scenario(req: BacklogPropagationRequest) -> BacklogPropagationResponse:
+    """Run one scenario on a worker thread so the event loop stays free"""
+    return await asyncio.to_thread(_BACKLOG_ENGINE.simulate_propagation, req, req.seed)
 
 
 @app.post("/sim/backlog/quick-scenarios")
@@ -540,487 +1049,378 @@ async def quick_backlog_scenarios(
     - Recovery: Clearing existing backlog with boost
     - High Priority: Critical items aging rapidly
     """
-    try:
-        end_date = start_date + timedelta(days=days - 1)
-        
-        # Generate daily capacities
-        daily_capacities = []
-        for day_offset in range(days):
-            day = start_date + timedelta(days=day_offset)
-            daily_capacities.append(DailyCapacity(
-                date=day,
-                total_capacity_hours=daily_capacity_hours,
-                backlog_capacity_hours=daily_capacity_hours * 0.6,
-                new_work_capacity_hours=daily_capacity_hours * 0.4,
-                staff_count=10,
-                productivity_modifier=1.0,
-                max_items_per_day=100,
-                max_complex_items_per_day=10
-            ))
-        
-        # Generate daily demands
-        daily_demands = []
-        for day_offset in range(days):
-            day = start_date + timedelta(days=day_offset)
-            daily_demands.append(DailyDemand(
-                date=day,
-                new_items_by_priority={
-                    BacklogPriority.LOW: int(daily_demand_count * 0.4),
-                    BacklogPriority.MEDIUM: int(daily_demand_count * 0.3),
-                    BacklogPriority.HIGH: int(daily_demand_count * 0.2),
-                    BacklogPriority.CRITICAL: int(daily_demand_count * 0.1)
-                },
-                new_items_by_complexity={
-                    Complexity.SIMPLE: int(daily_demand_count * 0.5),
-                    Complexity.MODERATE: int(daily_demand_count * 0.35),
-                    Complexity.COMPLEX: int(daily_demand_count * 0.15)
-                },
-                total_estimated_effort_hours=daily_demand_count * 0.5
-            ))
-        
-        # Generate initial backlog if specified
-        engine = BacklogPropagationEngine(seed=42)
-        initial_items = []
-        for i in range(initial_backlog_count):
-            priority_weights = {
-                BacklogPriority.LOW: 0.3,
-                BacklogPriority.MEDIUM: 0.35,
-                BacklogPriority.HIGH: 0.25,
-                BacklogPriority.CRITICAL: 0.1
-            }
-            priority = random.choices(
-                list(priority_weights.keys()),
-                weights=list(priority_weights.values())
-            )[0]
-            
-            # Items have been in backlog 1-5 days
-            days_old = random.randint(1, 5)
-            created = start_date - timedelta(days=days_old)
-            
-            item = BacklogItem(
-                id=f"INITIAL-{i+1:04d}",
-                item_type="work_item",
-                priority=priority,
-                original_priority=priority,
-                complexity=random.choice([Complexity.SIMPLE, Complexity.MODERATE, Complexity.COMPLEX]),
-                estimated_effort_minutes=random.randint(30, 90),
-                created_date=created,
-                due_date=start_date + timedelta(days=1),
-                status=ItemStatus.PENDING,
-                days_in_backlog=days_old,
-                propagation_count=days_old
-            )
-            initial_items.append(item)
-        
+    args = (organization_id, start_date, days, daily_demand_count, daily_capacity_hours, initial_backlog_count)
+    scenario_requests = _quick_scenario_requests(*args)
+    
+    # Scenarios are independent, so they run concurrently; the body is built
+    # only once all have finished, so a failure becomes an error response
+    results = await asyncio.gather(*(_run_quick_scenario(req) for req in scenario_requests.values()))
+    scenarios = dict(zip(scenario_requests, results))
+    
+    return {
+        **_quick_scenarios_header(*args),
+        "scenario_summaries": {
+            name: _scenario_summary(scenario) for name, scenario in scenarios.items()
+        },
+        "recommendations": _generate_backlog_recommendations(scenarios)
+    }
+
+
+@app.post("/sim/backlog/quick-scenarios/stream")
+async def stream_quick_backlog_scenarios(
+    http_request: Request,
+    organization_id: str,
+    start_date: date,
+    days: int = 30,
+    daily_demand_count: int = 50,
+    daily_capacity_hours: float = 40.0,
+    initial_backlog_count: int = 0
+):
+    """
+    Run the quick backlog scenarios and stream their summaries as NDJSON
+    
+    Emits one JSON record per line: a "header" record echoing the inputs, one
+    "scenario" record per scenario as soon as its simulation finishes (in
+    completion order), and a closing "recommendations" record. If a scenario
+    fails, the stream ends with an "error" record instead, since the 200 status
+    has already been sent.
+    """
+    args = (organization_id, start_date, days, daily_demand_count, daily_capacity_hours, initial_backlog_count)
+    scenario_requests = _quick_scenario_requests(*args)
+    path = http_request.url.path
+    
+    async def run_named(name: str, req: BacklogPropagationRequest):
+        return name, await _run_quick_scenario(req)
+    
+    async def ndjson_lines():
+        yield orjson.dumps({"type": "header", **_quick_scenarios_header(*args)}) + b"\n"
+        pending = [asyncio.ensure_future(run_named(name, req)) for name, req in scenario_requests.items()]
         scenarios = {}
-        
-        # Scenario 1: Balanced
-        balanced_profile = BacklogPropagationProfile(
-            propagation_rate=1.0,
-            decay_rate=0.05,
-            max_backlog_capacity=500,
-            aging_enabled=True,
-            aging_threshold_days=3,
-            overflow_strategy=OverflowStrategy.DEFER,
-            sla_breach_threshold_days=2,
-            sla_penalty_per_day=100.0,
-            recovery_rate_multiplier=1.0
-        )
-        
-        balanced_request = BacklogPropagationRequest(
-            organization_id=organization_id,
-            start_date=start_date,
-            end_date=end_date,
-            profile=balanced_profile,
-            initial_backlog_items=initial_items.copy(),
-            daily_capacities=daily_capacities.copy(),
-            daily_demands=daily_demands.copy(),
-            seed=42
-        )
-        
-        engine_balanced = BacklogPropagationEngine(seed=42)
-        scenarios["balanced"] = engine_balanced.simulate_propagation(balanced_request)
-        
-        # Scenario 2: Overflow
-        overflow_profile = BacklogPropagationProfile(
-            propagation_rate=1.0,
-            decay_rate=0.02,
-            max_backlog_capacity=200,
-            aging_enabled=True,
-            aging_threshold_days=2,
-            overflow_strategy=OverflowStrategy.REJECT,
-            sla_breach_threshold_days=1,
-            sla_penalty_per_day=150.0,
-            recovery_rate_multiplier=1.0
-        )
-        
-        # Increase demand for overflow
-        overflow_demands = []
-        for day_offset in range(days):
-            day = start_date + timedelta(days=day_offset)
-            overflow_demands.append(DailyDemand(
-                date=day,
-                new_items_by_priority={
-                    BacklogPriority.LOW: int(daily_demand_count * 0.6),
-                    BacklogPriority.MEDIUM: int(daily_demand_count * 0.5),
-                    BacklogPriority.HIGH: int(daily_demand_count * 0.3),
-                    BacklogPriority.CRITICAL: int(daily_demand_count * 0.15)
-                },
-                new_items_by_complexity={
-                    Complexity.SIMPLE: int(daily_demand_count * 0.5),
-                    Complexity.MODERATE: int(daily_demand_count * 0.35),
-                    Complexity.COMPLEX: int(daily_demand_count * 0.15)
-                },
-                total_estimated_effort_hours=daily_demand_count * 0.75
-            ))
-        
-        overflow_request = BacklogPropagationRequest(
-            organization_id=organization_id,
-            start_date=start_date,
-            end_date=end_date,
-            profile=overflow_profile,
-            initial_backlog_items=initial_items.copy(),
-            daily_capacities=daily_capacities.copy(),
-            daily_demands=overflow_demands,
-            seed=43
-        )
-        
-        engine_overflow = BacklogPropagationEngine(seed=43)
-        scenarios["overflow"] = engine_overflow.simulate_propagation(overflow_request)
-        
-        # Scenario 3: Recovery
-        recovery_profile = BacklogPropagationProfile(
-            propagation_rate=1.0,
-            decay_rate=0.10,
-            max_backlog_capacity=500,
-            aging_enabled=False,  # Focus on clearing, not aging
-            aging_threshold_days=5,
-            overflow_strategy=OverflowStrategy.DEFER,
-            sla_breach_threshold_days=3,
-            sla_penalty_per_day=100.0,
-            recovery_rate_multiplier=1.50  # 50% recovery boost
-        )
-        
-        # Recovery capacities with boost
-        recovery_capacities = []
-        for day_offset in range(days):
-            day = start_date + timedelta(days=day_offset)
-            recovery_capacities.append(DailyCapacity(
-                date=day,
-                total_capacity_hours=daily_capacity_hours * 1.3,
-                backlog_capacity_hours=daily_capacity_hours * 0.9,  # 90% to backlog
-                new_work_capacity_hours=daily_capacity_hours * 0.4,
-                staff_count=13,
-                productivity_modifier=1.2,  # 20% productivity boost
-                max_items_per_day=130,
-                max_complex_items_per_day=15
-            ))
-        
-        # Reduce demand during recovery
-        recovery_demands = []
-        for day_offset in range(days):
-            day = start_date + timedelta(days=day_offset)
-            recovery_demands.append(DailyDemand(
-                date=day,
-                new_items_by_priority={
-                    BacklogPriority.LOW: int(daily_demand_count * 0.2),
-                    BacklogPriority.MEDIUM: int(daily_demand_count * 0.15),
-                    BacklogPriority.HIGH: int(daily_demand_count * 0.10),
-                    BacklogPriority.CRITICAL: int(daily_demand_count * 0.05)
-                },
-                new_items_by_complexity={
-                    Complexity.SIMPLE: int(daily_demand_count * 0.3),
-                    Complexity.MODERATE: int(daily_demand_count * 0.15),
-                    Complexity.COMPLEX: int(daily_demand_count * 0.05)
-                },
-                total_estimated_effort_hours=daily_demand_count * 0.25
-            ))
-        
-        recovery_request = BacklogPropagationRequest(
-            organization_id=organization_id,
-            start_date=start_date,
-            end_date=end_date,
-            profile=recovery_profile,
-            initial_backlog_items=initial_items.copy(),
-            daily_capacities=recovery_capacities,
-            daily_demands=recovery_demands,
-            seed=44
-        )
-        
-        engine_recovery = BacklogPropagationEngine(seed=44)
-        scenarios["recovery"] = engine_recovery.simulate_propagation(recovery_request)
-        
-        # Scenario 4: High Priority Aging
-        aging_profile = BacklogPropagationProfile(
-            propagation_rate=1.0,
-            decay_rate=0.03,
-            max_backlog_capacity=500,
-            aging_enabled=True,
-            aging_threshold_days=1,  # Rapid aging
-            overflow_strategy=OverflowStrategy.ESCALATE,
-            sla_breach_threshold_days=1,
-            sla_penalty_per_day=200.0,
-            recovery_rate_multiplier=1.0
-        )
-        
-        aging_request = BacklogPropagationRequest(
-            organization_id=organization_id,
-            start_date=start_date,
-            end_date=end_date,
-            profile=aging_profile,
-            initial_backlog_items=initial_items.copy(),
-            daily_capacities=daily_capacities.copy(),
-            daily_demands=daily_demands.copy(),
-            seed=45
-        )
-        
-        engine_aging = BacklogPropagationEngine(seed=45)
-        scenarios["high_priority_aging"] = engine_aging.simulate_propagation(aging_request)
-        
-        # Return summary comparisons
-        return {
-            "organization_id": organization_id,
-            "simulation_period": {
-                "start_date": start_date.isoformat(),
-                "end_date": end_date.isoformat(),
-                "total_days": days
-            },
-            "input_parameters": {
-                "daily_demand_count": daily_demand_count,
-                "daily_capacity_hours": daily_capacity_hours,
-                "initial_backlog_count": initial_backlog_count
-            },
-            "scenario_summaries": {
-                name: {
-                    "final_backlog_count": scenario.final_backlog_count,
-                    "total_items_processed": scenario.summary_stats["total_items_processed"],
-                    "total_new_items": scenario.summary_stats["total_new_items"],
-                    "net_change": scenario.summary_stats["net_backlog_change"],
-                    "avg_daily_backlog": scenario.summary_stats["avg_daily_backlog"],
-                    "max_daily_backlog": scenario.summary_stats["max_daily_backlog"],
-                    "avg_sla_compliance": scenario.summary_stats["avg_sla_compliance_rate"],
-                    "total_sla_breaches": scenario.summary_stats["total_sla_breaches"],
-                    "total_financial_impact": scenario.summary_stats["total_financial_impact"],
-                    "avg_recovery_days": scenario.summary_stats["avg_recovery_days"]
-                }
-                for name, scenario in scenarios.items()
-            },
-            "recommendations": _generate_backlog_recommendations(scenarios)
-        }
-    except Exception as e:
-        raise HTTPException(
-            status_code=500,
-            detail=f"Quick backlog scenarios failed: {str(e)}"
-        )
+        try:
+            for next_done in asyncio.as_completed(pending):
+                name, scenario = await next_done
+                scenarios[name] = scenario
+                yield orjson.dumps({
+                    "type": "scenario",
+                    "name": name,
+                    "summary": _scenario_summary(scenario)
+                }) + b"\n"
+            recommendations = _generate_backlog_recommendations(scenarios)
+        except Exception as exc:
+            for task in pending:
+                task.cancel()
+            yield orjson.dumps({"type": "error", "detail": f"{path} failed: {exc}"}) + b"\n"
+            return
+        yield orjson.dumps({"type": "recommendations", "recommendations": recommendations}) + b"\n"
+    
+    return StreamingResponse(ndjson_lines(), media_type="application/x-ndjson")
 
 
+def _scenario_summary(scenario: BacklogPropagationResponse) -> Dict:
+    """Condense one scenario result for the quick-scenarios comparison"""
+    stats = scenario.summary_stats
+    return {
+        "final_backlog_count": scenario.final_backlog_count,
+        "total_items_processed": stats["total_items_processed"],
+        "total_new_items": stats["total_new_items"],
+        "net_change": stats["net_backlog_change"],
+        "avg_daily_backlog": stats["avg_daily_backlog"],
+        "max_daily_backlog": stats["max_daily_backlog"],
+        "avg_sla_compliance": stats["avg_sla_compliance_rate"],
+        "total_sla_breaches": stats["total_sla_breaches"],
+        "total_financial_impact": stats["total_financial_impact"],
+        "avg_recovery_days": stats["avg_recovery_days"]
+    }
+
+
+# Recommendation messages; only the SLA and recovery ones take values
+_CAPACITY_RECOMMENDATION = (
+    "Overflow scenario shows significant backlog accumulation. "
+    "Consider increasing capacity by 20-30% or implementing overflow strategies."
+)
+_SLA_RECOMMENDATION = (
+    "SLA compliance is low at {:.1f}%. "
+    "Consider extending SLA thresholds or prioritizing backlog resolution."
+)
+_RECOVERY_RECOMMENDATION = (
+    "Recovery strategy is effective, clearing {} items. "
+    "Consider implementing during backlog spikes."
+)
+_PRIORITY_AGING_RECOMMENDATION = (
+    "Rapid priority aging creates pressure on high-priority lanes. "
+    "Balance aging thresholds to avoid over-escalation."
+)
+
 def _generate_backlog_recommendations(scenarios: Dict) -> Dict:
     """Generate recommendations based on scenario comparisons"""
     recommendations = {}
     
     # Compare scenarios
     balanced = scenarios["balanced"]
-    overflow = scenarios["overflow"]
-    recovery = scenarios["recovery"]
     aging = scenarios["high_priority_aging"]
+    balanced_stats = balanced.summary_stats
+    overflow_stats = scenarios["overflow"].summary_stats
+    recovery_stats = scenarios["recovery"].summary_stats
     
     # Capacity recommendations
-    if overflow.summary_stats["avg_daily_backlog"] > balanced.summary_stats["avg_daily_backlog"] * 1.5:
-        recommendations["capacity"] = (
-            "Overflow scenario shows significant backlog accumulation. "
-            "Consider increasing capacity by 20-30% or implementing overflow strategies."
-        )
+    if overflow_stats["avg_daily_backlog"] > balanced_stats["avg_daily_backlog"] * 1.5:
+        recommendations["capacity"] = _CAPACITY_RECOMMENDATION
     
     # SLA recommendations
-    if balanced.summary_stats["avg_sla_compliance_rate"] < 80:
-        recommendations["sla"] = (
-            f"SLA compliance is low at {balanced.summary_stats['avg_sla_compliance_rate']:.1f}%. "
-            "Consider extending SLA thresholds or prioritizing backlog resolution."
-        )
+    sla_compliance = balanced_stats["avg_sla_compliance_rate"]
+    if sla_compliance < 80:
+        recommendations["sla"] = _SLA_RECOMMENDATION.format(sla_compliance)
     
     # Recovery effectiveness
-    if recovery.summary_stats["net_backlog_change"] < -20:
-        recommendations["recovery"] = (
-            f"Recovery strategy is effective, clearing {abs(recovery.summary_stats['net_backlog_change'])} items. "
-            "Consider implementing during backlog spikes."
-        )
+    net_change = recovery_stats["net_backlog_change"]
+    if net_change < -20:
+        recommendations["recovery"] = _RECOVERY_RECOMMENDATION.format(-net_change)
     
     # Priority aging impact
-    aging_critical_count = aging.final_backlog_count
-    balanced_critical_count = balanced.final_backlog_count
-    if aging_critical_count > balanced_critical_count * 1.3:
-        recommendations["priority_aging"] = (
-            "Rapid priority aging creates pressure on high-priority lanes. "
-            "Balance aging thresholds to avoid over-escalation."
-        )
+    if aging.final_backlog_count > balanced.final_backlog_count * 1.3:
+        recommendations["priority_aging"] = _PRIORITY_AGING_RECOMMENDATION
     
     return recommendations
 
 
-@app.get("/sim/backlog/overflow-strategies")
-async def get_overflow_strategies():
-    """Get available overflow strategies and their descriptions"""
-    return {
-        "strategies": [
-            {
-                "name": OverflowStrategy.REJECT,
-                "description": "Reject new items when backlog capacity is exceeded",
-                "use_case": "Strict capacity limits, protect existing backlog",
-                "impact": "New work is rejected, existing items preserved"
-            },
-            {
-                "name": OverflowStrategy.DEFER,
-                "description": "Defer lower priority items to future periods",
-                "use_case": "Temporary overflow, expect capacity recovery",
-                "impact": "Items moved to future, SLA extended"
-            },
-            {
-                "name": OverflowStrategy.ESCALATE,
-                "description": "Escalate items to higher priority lanes",
-                "use_case": "Urgent work, need attention on overflow",
-                "impact": "Priority inflation, increased pressure"
-            },
-            {
-                "name": OverflowStrategy.OUTSOURCE,
-                "description": "Mark items for outsourcing to external teams",
-                "use_case": "Extended overflow, available external capacity",
-                "impact": "Items removed from backlog, outsourcing cost"
-            }
-        ],
-        "selection_guidance": {
-            "low_volume_overflow": OverflowStrategy.DEFER,
-            "high_volume_overflow": OverflowStrategy.REJECT,
-            "critical_work": OverflowStrategy.ESCALATE,
-            "consistent_overflow": OverflowStrategy.OUTSOURCE
+# Strategy catalog is static, so encode it once at import time
+_OVERFLOW_STRATEGIES_BODY, _OVERFLOW_STRATEGIES_ETAG = _static_json({
+    "strategies": [
+        {
+            "name": OverflowStrategy.REJECT,
+            "description": "Reject new items when backlog capacity is exceeded",
+            "use_case": "Strict capacity limits, protect existing backlog",
+            "impact": "New work is rejected, existing items preserved"
+        },
+        {
+            "name": OverflowStrategy.DEFER,
+            "description": "Defer lower priority items to future periods",
+            "use_case": "Temporary overflow, expect capacity recovery",
+            "impact": "Items moved to future, SLA extended"
+        },
+        {
+            "name": OverflowStrategy.ESCALATE,
+            "description": "Escalate items to higher priority lanes",
+            "use_case": "Urgent work, need attention on overflow",
+            "impact": "Priority inflation, increased pressure"
+        },
+        {
+            "name": OverflowStrategy.OUTSOURCE,
+            "description": "Mark items for outsourcing to external teams",
+            "use_case": "Extended overflow, available external capacity",
+            "impact": "Items removed from backlog, outsourcing cost"
         }
+    ],
+    "selection_guidance": {
+        "low_volume_overflow": OverflowStrategy.DEFER,
+        "high_volume_overflow": OverflowStrategy.REJECT,
+        "critical_work": OverflowStrategy.ESCALATE,
+        "consistent_overflow": OverflowStrategy.OUTSOURCE
     }
+})
 
+@app.get("/sim/backlog/overflow-strategies")
+async def get_overflow_strategies(request: Request):
+    """Get available overflow strategies and their descriptions"""
+    return _etag_response(request, _OVERFLOW_STRATEGIES_BODY, _OVERFLOW_STRATEGIES_ETAG)
 
-@app.get("/sim/backlog/profile-templates")
-async def get_backlog_profile_templates():
-    """Get pre-configured backlog propagation profile templates"""
-    return {
-        "templates": {
-            "standard": {
-                "name": "Standard Flow",
-                "description": "Balanced propagation with moderate constraints",
-                "profile": {
-                    "propagation_rate": 1.0,
-                    "decay_rate": 0.05,
-                    "max_backlog_capacity": 500,
-                    "aging_enabled": True,
-                    "aging_threshold_days": 3,
-                    "overflow_strategy": "defer",
-                    "sla_breach_threshold_days": 2,
-                    "sla_penalty_per_day": 100.0,
-                    "recovery_rate_multiplier": 1.0
-                },
-                "best_for": "Normal operations, predictable demand"
+
+# Profile templates are static, so encode them once at import time
+_PROFILE_TEMPLATES_BODY, _PROFILE_TEMPLATES_ETAG = _static_json({
+    "templates": {
+        "standard": {
+            "name": "Standard Flow",
+            "description": "Balanced propagation with moderate constraints",
+            "profile": {
+                "propagation_rate": 1.0,
+                "decay_rate": 0.05,
+                "max_backlog_capacity": 500,
+                "aging_enabled": True,
+                "aging_threshold_days": 3,
+                "overflow_strategy": "defer",
+                "sla_breach_threshold_days": 2,
+                "sla_penalty_per_day": 100.0,
+                "recovery_rate_multiplier": 1.0
             },
-            "high_volume": {
-                "name": "High Volume",
-                "description": "Handles high demand with strict capacity limits",
-                "profile": {
-                    "propagation_rate": 1.0,
-                    "decay_rate": 0.02,
-                    "max_backlog_capacity": 300,
-                    "aging_enabled": True,
-                    "aging_threshold_days": 2,
-                    "overflow_strategy": "reject",
-                    "sla_breach_threshold_days": 1,
-                    "sla_penalty_per_day": 150.0,
-                    "recovery_rate_multiplier": 1.0
-                },
-                "best_for": "High demand environments, capacity constraints"
+            "best_for": "Normal operations, predictable demand"
+        },
+        "high_volume": {
+            "name": "High Volume",
+            "description": "Handles high demand with strict capacity limits",
+            "profile": {
+                "propagation_rate": 1.0,
+                "decay_rate": 0.02,
+                "max_backlog_capacity": 300,
+                "aging_enabled": True,
+                "aging_threshold_days": 2,
+                "overflow_strategy": "reject",
+                "sla_breach_threshold_days": 1,
+                "sla_penalty_per_day": 150.0,
+                "recovery_rate_multiplier": 1.0
             },
-            "recovery_mode": {
-                "name": "Recovery Mode",
-                "description": "Optimized for clearing existing backlog",
-                "profile": {
-                    "propagation_rate": 0.8,
-                    "decay_rate": 0.10,
-                    "max_backlog_capacity": 1000,
-                    "aging_enabled": False,
-                    "aging_threshold_days": 5,
-                    "overflow_strategy": "defer",
-                    "sla_breach_threshold_days": 3,
-                    "sla_penalty_per_day": 100.0,
-                    "recovery_rate_multiplier": 1.50
-                },
-                "best_for": "Backlog reduction initiatives, capacity boost periods"
+            "best_for": "High demand environments, capacity constraints"
+        },
+        "recovery_mode": {
+            "name": "Recovery Mode",
+            "description": "Optimized for clearing existing backlog",
+            "profile": {
+                "propagation_rate": 0.8,
+                "decay_rate": 0.10,
+                "max_backlog_capacity": 1000,
+                "aging_enabled": False,
+                "aging_threshold_days": 5,
+                "overflow_strategy": "defer",
+                "sla_breach_threshold_days": 3,
+                "sla_penalty_per_day": 100.0,
+                "recovery_rate_multiplier": 1.50
             },
-            "strict_sla": {
-                "name": "Strict SLA",
-                "description": "Prioritizes SLA compliance and rapid resolution",
-                "profile": {
-                    "propagation_rate": 1.0,
-                    "decay_rate": 0.03,
-                    "max_backlog_capacity": 400,
-                    "aging_enabled": True,
-                    "aging_threshold_days": 1,
-                    "overflow_strategy": "escalate",
-                    "sla_breach_threshold_days": 1,
-                    "sla_penalty_per_day": 250.0,
-                    "recovery_rate_multiplier": 1.2
-                },
-                "best_for": "SLA-sensitive operations, customer-facing work"
+            "best_for": "Backlog reduction initiatives, capacity boost periods"
+        },
+        "strict_sla": {
+            "name": "Strict SLA",
+            "description": "Prioritizes SLA compliance and rapid resolution",
+            "profile": {
+                "propagation_rate": 1.0,
+                "decay_rate": 0.03,
+                "max_backlog_capacity": 400,
+                "aging_enabled": True,
+                "aging_threshold_days": 1,
+                "overflow_strategy": "escalate",
+                "sla_breach_threshold_days": 1,
+                "sla_penalty_per_day": 250.0,
+                "recovery_rate_multiplier": 1.2
             },
-            "flexible": {
-                "name": "Flexible Flow",
-                "description": "Accommodates variability with elastic capacity",
-                "profile": {
-                    "propagation_rate": 1.0,
-                    "decay_rate": 0.07,
-                    "max_backlog_capacity": None,
-                    "aging_enabled": True,
-                    "aging_threshold_days": 4,
-                    "overflow_strategy": "defer",
-                    "sla_breach_threshold_days": 3,
-                    "sla_penalty_per_day": 75.0,
-                    "recovery_rate_multiplier": 1.1
-                },
-                "best_for": "Variable demand, flexible capacity, internal work"
-            }
+            "best_for": "SLA-sensitive operations, customer-facing work"
+        },
+        "flexible": {
+            "name": "Flexible Flow",
+            "description": "Accommodates variability with elastic capacity",
+            "profile": {
+                "propagation_rate": 1.0,
+                "decay_rate": 0.07,
+                "max_backlog_capacity": None,
+                "aging_enabled": True,
+                "aging_threshold_days": 4,
+                "overflow_strategy": "defer",
+                "sla_breach_threshold_days": 3,
+                "sla_penalty_per_day": 75.0,
+                "recovery_rate_multiplier": 1.1
+            },
+            "best_for": "Variable demand, flexible capacity, internal work"
         }
     }
+})
+
+@app.get("/sim/backlog/profile-templates")
+async def get_backlog_profile_templates(request: Request):
+    """Get pre-configured backlog propagation profile templates"""
+    return _etag_response(request, _PROFILE_TEMPLATES_BODY, _PROFILE_TEMPLATES_ETAG)
 
 
 # ============================================================================
 # Service Statistics
 # ============================================================================
 
+# Stats only reflect the enum definitions, so encode them once at import time
+_STATS_BODY, _STATS_ETAG = _static_json({
+    "supported_scenarios": len(SimulationScenario),
+    "shift_types": [s.value for s in ShiftType],
+    "priority_levels": [p.value for p in Priority],
+    "max_simulation_days": 365,
+    "features": [
+        "Demand generation",
+        "Schedule optimization",
+        "Scenario modeling",
+        "Capacity planning",
+        "Productivity variance simulation",
+        "Backlog propagation modeling"
+    ],
+    "productivity_variance": {
+        "scenarios": [s.value for s in VarianceScenario],
+        "factor_categories": [c.value for c in FactorCategory],
+        "supported_distributions": ["normal", "uniform", "beta", "exponential"],
+        "temporal_patterns": True,
+        "learning_curves": True
+    },
+    "backlog_propagation": {
+        "overflow_strategies": [s.value for s in OverflowStrategy],
+        "item_priorities": [p.value for p in BacklogPriority],
+        "complexity_levels": [c.value for c in Complexity],
+        "sla_tracking": True,
+        "priority_aging": True,
+        "profile_templates": 5
+    }
+})
+
 @app.get("/sim/stats")
-async def simulation_stats():
+async def simulation_stats(request: Request):
     """Get simulation service statistics"""
-    return {
-        "supported_scenarios": len(SimulationScenario),
-        "shift_types": [s.value for s in ShiftType],
-        "priority_levels": [p.value for p in Priority],
-        "max_simulation_days": 365,
-        "features": [
-            "Demand generation",
-            "Schedule optimization",
-            "Scenario modeling",
-            "Capacity planning",
-            "Productivity variance simulation",
-            "Backlog propagation modeling"
-        ],
-        "productivity_variance": {
-            "scenarios": [s.value for s in VarianceScenario],
-            "factor_categories": [c.value for c in FactorCategory],
-            "supported_distributions": ["normal", "uniform", "beta", "exponential"],
-            "temporal_patterns": True,
-            "learning_curves": True
-        },
-        "backlog_propagation": {
-            "overflow_strategies": [s.value for s in OverflowStrategy],
-            "item_priorities": [p.value for p in BacklogPriority],
-            "complexity_levels": [c.value for c in Complexity],
-            "sla_tracking": True,
-            "priority_aging": True,
-            "profile_templates": 5
-        }
+    return _etag_response(request, _STATS_BODY, _STATS_ETAG)
+
+# ============================================================================
+# Debug Endpoints
+# ============================================================================
+
+# Opt-in only: the batch gateway lets one request fan out to many routes
+DEBUG_BATCH_ENABLED = os.environ.get("SIM_DEBUG_BATCH") == "1"
+MAX_BATCH_CALLS = 32
+
+class BatchCall(BaseModel):
+    method: Literal["GET"] = "GET"
+    path: str = Field(pattern=r"^/")
+
+class BatchRequest(BaseModel):
+    calls: List[BatchCall] = Field(max_length=MAX_BATCH_CALLS)
+
+async def _dispatch_get(path: str) -> Dict:
+    """Run one GET through the app in-process and capture its reply"""
+    path, _, query = path.partition("?")
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "root_path": "",
+        "query_string": query.encode(),
+        "headers": [],
+        "client": None,
+        "server": None,
     }
+    reply = {"status_code": 500, "content_type": b"", "body": []}
+    
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+    
+    async def send(message):
+        if message["type"] == "http.response.start":
+            reply["status_code"] = message["status"]
+            reply["content_type"] = dict(message.get("headers", [])).get(b"content-type", b"")
+        elif message["type"] == "http.response.body":
+            reply["body"].append(message.get("body", b""))
+    
+    await app(scope, receive, send)
+    body = b"".join(reply["body"])
+    # JSON bodies are embedded as-is rather than decoded and re-encoded
+    if reply["content_type"].startswith(b"application/json") and body:
+        content = orjson.Fragment(body)
+    else:
+        content = body.decode(errors="replace")
+    return {"path": scope["path"], "status_code": reply["status_code"], "body": content}
+
+if DEBUG_BATCH_ENABLED:
+    @app.post("/debug/batch")
+    async def debug_batch(batch: BatchRequest):
+        """
+        Run several read-only calls in one round trip
+        
+        Each call is dispatched through the full app in order and its reply
+        is returned under "results". Enabled only with SIM_DEBUG_BATCH=1.
+        """
+        results = [await _dispatch_get(call.path) for call in batch.calls]
+        return ORJSONResponse({"results": results})
 
 if __name__ == "__main__":
     import uvicorn
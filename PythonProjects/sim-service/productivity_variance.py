@@ -4,12 +4,17 @@ Advanced simulation of productivity variations and their staffing impact
 """
 from typing import List, Dict, Optional, Tuple, Any
 from datetime import date, datetime, timedelta
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr, model_validator
 from enum import Enum
-import random
-import math
+from functools import cached_property
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+import multiprocessing
+import os
+import threading
+import time
 import numpy as np
-from scipy import stats
+from scipy.signal import lfilter
 
 
 # ============================================================================
@@ -73,6 +78,7 @@ class ProductivityVarianceFactor(BaseModel):
     impact_magnitude: float = Field(..., ge=-1.0, le=1.0)  # -100% to +100%
     probability: float = Field(default=1.0, ge=0.0, le=1.0)  # Chance of occurring
     duration_hours: int = Field(default=1, ge=1, le=24)
+    description: Optional[str] = None
 
 
 class VarianceSimulationRequest(BaseModel):
@@ -95,6 +101,17 @@ class VarianceSimulationRequest(BaseModel):
     # Optional factors
     variance_factors: List[ProductivityVarianceFactor] = []
     shock_events: Optional[List[Dict]] = None  # [{date, impact}]
+    
+    @model_validator(mode="after")
+    def check_date_range(self):
+        if self.end_date < self.start_date:
+            raise ValueError("end_date must be on or after start_date")
+        return self
+    
+    @cached_property
+    def total_days(self) -> int:
+        """Number of days in the simulation window (inclusive)"""
+        return (self.end_date - self.start_date).days + 1
 
 
 class ProductivityDataPoint(BaseModel):
@@ -108,7 +125,7 @@ class ProductivityDataPoint(BaseModel):
     baseline_staff_needed: int
     adjusted_staff_needed: int
     staffing_variance: int
-    contributing_factors: List[str] = []
+    contributing_factors: Tuple[str, ...] = ()
 
 
 class VarianceSimulationResponse(BaseModel):
@@ -132,6 +149,83 @@ class VarianceSimulationResponse(BaseModel):
     # Execution metadata
     execution_duration_ms: float
     seed_used: Optional[int]
+    
+    # First-run modifiers kept as an array for callers doing numeric work;
+    # private, so it never appears in the serialized response
+    _modifiers: Optional[np.ndarray] = PrivateAttr(default=None)
+    
+    @property
+    def modifiers(self) -> np.ndarray:
+        """float32 productivity modifiers of the first run, one per data point"""
+        if self._modifiers is None:
+            self._modifiers = np.fromiter(
+                (dp.productivity_modifier for dp in self.data_points),
+                dtype=np.float32,
+                count=len(self.data_points)
+            )
+        return self._modifiers
+
+
+def _as_float(value) -> float:
+    """Convert a float32 reduction to a Python float without float32 noise digits"""
+    return round(float(value), 6)
+
+
+# Shared contributing_factors for every day without factors or shocks
+_NO_FACTORS: Tuple[str, ...] = ()
+
+# Monte Carlo simulations above this many (run, day) cells are split into chunks
+PARALLEL_CELL_THRESHOLD = 1_000_000
+
+# Fixed chunk count, so a seed gives the same result whatever the host's CPU count
+PARALLEL_CHUNKS = 8
+
+# Process pool shared by every simulation, created on first use
+_process_pool: Optional[ProcessPoolExecutor] = None
+_process_pool_lock = threading.Lock()
+
+
+def _available_cpus() -> int:
+    """CPUs this process may run on, honouring any affinity pinning"""
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
+def _get_process_pool() -> Optional[ProcessPoolExecutor]:
+    """Return the shared pool, or None when only one CPU is available"""
+    global _process_pool
+    workers = min(_available_cpus(), PARALLEL_CHUNKS)
+    if workers < 2:
+        return None
+    with _process_pool_lock:
+        if _process_pool is None:
+            # Spawned children: forking a threaded server process is not safe
+            _process_pool = ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=multiprocessing.get_context("spawn")
+            )
+        return _process_pool
+
+
+def shutdown_process_pool() -> None:
+    """Stop the shared pool's worker processes, if it was ever started"""
+    global _process_pool
+    with _process_pool_lock:
+        if _process_pool is not None:
+            _process_pool.shutdown()
+            _process_pool = None
+
+
+def _simulate_run_chunk(
+    request: "VarianceSimulationRequest",
+    runs: int,
+    rng: np.random.Generator
+) -> Tuple[np.ndarray, List[Tuple[str, ...]], List[Tuple[str, ...]]]:
+    """Process-pool entry point: simulate one chunk of runs with its own generator"""
+    engine = ProductivityVarianceEngine()
+    engine.rng = rng
+    return engine._simulate_modifiers(request, runs)
 
 
 # ============================================================================
@@ -142,343 +236,419 @@ class ProductivityVarianceEngine:
     """Core engine for simulating productivity variance"""
     
     def __init__(self, seed: Optional[int] = None):
-        """Initialize the variance engine"""
-        if seed is not None:
-            random.seed(seed)
-            np.random.seed(seed)
-        self.previous_value = None  # For autocorrelation
+        """Initialize the variance engine with its own PCG64 generator"""
+        self.rng = np.random.default_rng(seed)
+    
+    def reseed(self, seed: Optional[int] = None):
+        """Restart the generator; the RNG is the only state kept between runs"""
+        self.rng = np.random.default_rng(seed)
     
     def _generate_base_variance(
         self,
         profile: ProductivityVarianceProfile,
-        day_number: int = 0
-    ) -> float:
-        """Generate base productivity modifier from distribution"""
+        shape: Tuple[int, int]
+    ) -> np.ndarray:
+        """Generate base productivity modifiers for every (run, day) from the distribution
+        
+        Modifiers only need ~1e-4 precision, so the pipeline runs in float32 to
+        halve memory traffic on large Monte Carlo arrays. Draws are sampled in
+        float32 where the generator supports it and scaled in place.
+        """
         
         if profile.distribution_type == DistributionType.NORMAL:
             # Normal distribution
-            value = np.random.normal(
-                profile.mean_productivity_modifier,
-                profile.std_deviation
-            )
+            values = self.rng.standard_normal(shape, dtype=np.float32)
+            values *= profile.std_deviation
+            values += profile.mean_productivity_modifier
         
         elif profile.distribution_type == DistributionType.UNIFORM:
             # Uniform distribution between min and max
-            value = np.random.uniform(
-                profile.min_modifier,
-                profile.max_modifier
-            )
+            values = self.rng.random(shape, dtype=np.float32)
+            values *= profile.max_modifier - profile.min_modifier
+            values += profile.min_modifier
         
         elif profile.distribution_type == DistributionType.BETA:
-            # Beta distribution (good for bounded values)
+            # Beta distribution (good for bounded values); no float32 sampler exists
             alpha = 2.0
             beta_param = 2.0
-            scaled = np.random.beta(alpha, beta_param)
-            value = profile.min_modifier + scaled * (profile.max_modifier - profile.min_modifier)
+            values = self.rng.beta(alpha, beta_param, size=shape).astype(np.float32)
+            values *= profile.max_modifier - profile.min_modifier
+            values += profile.min_modifier
         
         elif profile.distribution_type == DistributionType.EXPONENTIAL:
             # Exponential distribution (for modeling delays/disruptions)
-            value = profile.mean_productivity_modifier * np.random.exponential(1.0)
+            values = self.rng.standard_exponential(shape, dtype=np.float32)
+            values *= profile.mean_productivity_modifier
         
         else:
             # Default to mean
-            value = profile.mean_productivity_modifier
-        
-        # Apply autocorrelation if enabled and we have previous value
-        if profile.autocorrelation > 0 and self.previous_value is not None:
-            value = (profile.autocorrelation * self.previous_value + 
-                    (1 - profile.autocorrelation) * value)
+            values = np.full(shape, profile.mean_productivity_modifier, dtype=np.float32)
         
         # Clamp to min/max
-        value = max(profile.min_modifier, min(profile.max_modifier, value))
-        self.previous_value = value
-        
-        return value
+        np.clip(values, profile.min_modifier, profile.max_modifier, out=values)
+        
+        # Apply autocorrelation as an AR(1) filter along each run:
+        # y[d] = rho * y[d-1] + (1 - rho) * x[d], starting from y[0] = x[0].
+        # Blends of clamped values stay within min/max, so no re-clamp is needed
+        if profile.autocorrelation > 0:
+            rho = np.float32(profile.autocorrelation)
+            b = np.array([1 - rho], dtype=np.float32)
+            a = np.array([1, -rho], dtype=np.float32)
+            values = lfilter(b, a, values, axis=1, zi=rho * values[:, :1])[0]
+        
+        return values
     
-    def _apply_learning_curve(
+    def _learning_curve_multiplier(
         self,
-        base_value: float,
-        day_number: int,
+        total_days: int,
         profile: ProductivityVarianceProfile
-    ) -> float:
-        """Apply learning curve effect"""
+    ) -> Optional[np.ndarray]:
+        """Learning curve effect as a (days,) multiplier table"""
         if not profile.learning_curve_enabled:
-            return base_value
+            return None
         
         # Sigmoid learning curve
+        day_idx = np.arange(total_days)
         plateau_days = profile.plateau_weeks * 7
-        learning_factor = 1.0 / (1.0 + math.exp(-profile.learning_rate * (day_number - plateau_days / 2)))
+        learning_factor = 1.0 / (1.0 + np.exp(-profile.learning_rate * (day_idx - plateau_days / 2)))
         
         # Learning improves productivity
         max_improvement = 0.2  # Up to 20% improvement
         improvement = learning_factor * max_improvement
         
-        return base_value * (1.0 + improvement)
+        return (1.0 + improvement).astype(np.float32)
     
-    def _apply_temporal_patterns(
+    def _temporal_multiplier(
         self,
-        base_value: float,
-        current_date: date,
+        dates: List[date],
         hour: Optional[int],
         profile: ProductivityVarianceProfile
-    ) -> float:
-        """Apply time-based patterns"""
-        value = base_value
+    ) -> Optional[np.ndarray]:
+        """Time-based patterns as a (days,) multiplier table, or None when there are none"""
+        has_time_of_day = hour is not None and bool(profile.time_of_day_impact)
+        if not (has_time_of_day or profile.day_of_week_impact or profile.seasonal_impact):
+            return None
+        
+        multipliers = np.ones(len(dates), dtype=np.float32)
         
         # Time of day impact
-        if hour is not None and profile.time_of_day_impact:
-            multiplier = profile.time_of_day_impact.get(hour, 1.0)
-            value *= multiplier
+        if has_time_of_day:
+            multipliers *= profile.time_of_day_impact.get(hour, 1.0)
         
         # Day of week impact
         if profile.day_of_week_impact:
-            dow = current_date.weekday()
-            multiplier = profile.day_of_week_impact.get(dow, 1.0)
-            value *= multiplier
+            dow_impact = profile.day_of_week_impact
+            multipliers *= np.array([dow_impact.get(d.weekday(), 1.0) for d in dates])
         
         # Seasonal impact (month)
         if profile.seasonal_impact:
-            month = current_date.month
-            multiplier = profile.seasonal_impact.get(month, 1.0)
-            value *= multiplier
+            month_impact = profile.seasonal_impact
+            multipliers *= np.array([month_impact.get(d.month, 1.0) for d in dates])
         
-        return value
+        return multipliers
     
-    def _apply_variance_factors(
+    def _variance_factor_multiplier(
         self,
-        base_value: float,
-        variance_factors: List[ProductivityVarianceFactor],
-        current_date: date
-    ) -> Tuple[float, List[str]]:
-        """Apply specific variance factors"""
-        value = base_value
-        applied_factors = []
-        
-        for factor in variance_factors:
-            # Check if factor occurs (probability check)
-            if random.random() < factor.probability:
-                impact = 1.0 + factor.impact_magnitude
-                value *= impact
-                applied_factors.append(factor.name)
-        
-        return value, applied_factors
+        shape: Tuple[int, int],
+        variance_factors: List[ProductivityVarianceFactor]
+    ) -> Tuple[Optional[np.ndarray], List[Tuple[str, ...]]]:
+        """Variance factors as a (runs, days) multiplier; names are reported per day for the first run"""
+        total_days = shape[1]
+        if not variance_factors:
+            return None, [_NO_FACTORS] * total_days
+        
+        # Roll every factor for every run and day in one draw (probability check)
+        probabilities = np.array([factor.probability for factor in variance_factors])
+        impacts = 1.0 + np.array([factor.impact_magnitude for factor in variance_factors])
+        hits = self.rng.random(shape + (len(variance_factors),), dtype=np.float32) < probabilities
+        multipliers = np.where(hits, impacts, 1.0).prod(axis=-1, dtype=np.float32)
+        
+        # Only the first run is serialized, so only its factor names are materialized,
+        # and only for the days where something actually fired
+        names = [factor.name for factor in variance_factors]
+        first_run_hits = hits[0]
+        applied_factors = [_NO_FACTORS] * total_days
+        for day_number in np.flatnonzero(first_run_hits.any(axis=-1)).tolist():
+            applied_factors[day_number] = tuple(
+                name for name, hit in zip(names, first_run_hits[day_number].tolist()) if hit
+            )
+        
+        return multipliers, applied_factors
     
-    def _apply_shock_events(
+    def _shock_multiplier(
         self,
-        base_value: float,
-        current_date: date,
+        total_days: int,
+        start_date: date,
         shock_events: Optional[List[Dict]]
-    ) -> Tuple[float, List[str]]:
-        """Apply sudden shock events"""
+    ) -> Tuple[Optional[np.ndarray], List[Tuple[str, ...]]]:
+        """Sudden shock events as a (days,) multiplier, with the shock names for each day"""
+        shock_names = [_NO_FACTORS] * total_days
         if not shock_events:
-            return base_value, []
-        
-        value = base_value
-        applied_shocks = []
+            return None, shock_names
         
+        shock_impact = np.ones(total_days, dtype=np.float32)
+        # Parse each shock date once and fold the impacts into the per-day vector
         for shock in shock_events:
             shock_date = datetime.strptime(shock['date'], '%Y-%m-%d').date()
-            if shock_date == current_date:
-                impact = 1.0 + shock.get('impact', 0.0)
-                value *= impact
+            day_number = (shock_date - start_date).days
+            if 0 <= day_number < total_days:
+                shock_impact[day_number] *= 1.0 + shock.get('impact', 0.0)
                 shock_name = shock.get('name', f'Shock on {shock_date}')
-                applied_shocks.append(shock_name)
+                shock_names[day_number] = shock_names[day_number] + (shock_name,)
         
-        return value, applied_shocks
+        return shock_impact, shock_names
     
-    def _apply_scenario_pattern(
+    def _scenario_multiplier(
         self,
-        base_value: float,
-        day_number: int,
-        total_days: int,
+        shape: Tuple[int, int],
         scenario: VarianceScenario
-    ) -> float:
-        """Apply scenario-specific patterns"""
+    ) -> Optional[np.ndarray]:
+        """Scenario-specific pattern as a (runs, days) or per-day (days,) multiplier"""
+        total_days = shape[1]
+        day_idx = np.arange(total_days)
         
         if scenario == VarianceScenario.CONSISTENT:
             # Low variance, stays close to base
-            variance = np.random.normal(0, 0.05)
-            return base_value * (1.0 + variance)
+            multiplier = self.rng.standard_normal(shape, dtype=np.float32)
+            multiplier *= 0.05
+            multiplier += 1.0
         
         elif scenario == VarianceScenario.VOLATILE:
             # High variance, large swings
-            variance = np.random.normal(0, 0.25)
-            return base_value * (1.0 + variance)
+            multiplier = self.rng.standard_normal(shape, dtype=np.float32)
+            multiplier *= 0.25
+            multiplier += 1.0
         
         elif scenario == VarianceScenario.DECLINING:
             # Linear decline over time
             decline_rate = 0.3 / total_days  # 30% decline over period
-            decline = decline_rate * day_number
-            return base_value * (1.0 - decline)
+            multiplier = 1.0 - decline_rate * day_idx
         
         elif scenario == VarianceScenario.IMPROVING:
             # Linear improvement over time
             improve_rate = 0.3 / total_days  # 30% improvement over period
-            improvement = improve_rate * day_number
-            return base_value * (1.0 + improvement)
+            multiplier = 1.0 + improve_rate * day_idx
         
         elif scenario == VarianceScenario.CYCLICAL:
             # Weekly cycle (7-day period)
-            cycle = math.sin(2 * math.pi * day_number / 7)
-            return base_value * (1.0 + 0.15 * cycle)
+            multiplier = 1.0 + 0.15 * np.sin(2 * np.pi * day_idx / 7)
         
         elif scenario == VarianceScenario.SHOCK:
             # Random shock events (10% chance per day)
-            if random.random() < 0.1:
-                shock = random.choice([-0.3, -0.2, 0.2, 0.3])
-                return base_value * (1.0 + shock)
+            hit = self.rng.random(shape, dtype=np.float32) < 0.1
+            shock = self.rng.choice([-0.3, -0.2, 0.2, 0.3], size=shape)
+            multiplier = 1.0 + np.where(hit, shock, 0.0)
+        
+        else:
+            return None
         
-        return base_value
+        return multiplier.astype(np.float32, copy=False)
     
     def _calculate_staffing_adjustment(
         self,
         baseline_staff: int,
-        productivity_modifier: float
-    ) -> int:
+        productivity_modifier: np.ndarray
+    ) -> np.ndarray:
         """Calculate adjusted staffing needs"""
         # If productivity is lower, more staff needed
-        adjusted = math.ceil(baseline_staff / productivity_modifier)
-        return max(1, adjusted)
+        adjusted = np.ceil(baseline_staff / productivity_modifier)
+        return np.maximum(1, adjusted).astype(np.int32)
+    
+    def _simulate_modifiers(
+        self,
+        request: VarianceSimulationRequest,
+        runs: int
+    ) -> Tuple[np.ndarray, List[Tuple[str, ...]], List[Tuple[str, ...]]]:
+        """Build the (runs, days) modifier array with per-day factor and shock names"""
+        total_days = request.total_days
+        dates = [request.start_date + timedelta(days=i) for i in range(total_days)]
+        
+        shape = (runs, total_days)
+        
+        # Generate base variance for every run and day in one batch
+        modifiers = self._generate_base_variance(request.profile, shape)
+        
+        # Build each pattern as a multiplier instead of applying it separately
+        scenario_multiplier = self._scenario_multiplier(shape, request.variance_scenario)
+        learning_multiplier = self._learning_curve_multiplier(total_days, request.profile)
+        temporal_multiplier = self._temporal_multiplier(
+            dates,
+            None,  # Could add hour-by-hour simulation
+            request.profile
+        )
+        factor_multiplier, factor_names = self._variance_factor_multiplier(
+            shape,
+            request.variance_factors
+        )
+        shock_multiplier, shock_names = self._shock_multiplier(
+            total_days,
+            request.start_date,
+            request.shock_events
+        )
+        
+        # Fold the per-day tables into one (days,) vector, then scale the
+        # (runs, days) array in place, so each full-size multiply is one pass
+        # with no temporaries. Patterns that are not configured are None and
+        # cost nothing
+        day_multiplier = None
+        for multiplier in (
+            scenario_multiplier,
+            learning_multiplier,
+            temporal_multiplier,
+            factor_multiplier,
+            shock_multiplier,
+        ):
+            if multiplier is None:
+                continue
+            if multiplier.ndim > 1:
+                modifiers *= multiplier
+            elif day_multiplier is None:
+                day_multiplier = multiplier
+            else:
+                day_multiplier = day_multiplier * multiplier
+        if day_multiplier is not None:
+            modifiers *= day_multiplier
+        
+        return modifiers, factor_names, shock_names
+    
+    def _simulate_modifiers_parallel(
+        self,
+        request: VarianceSimulationRequest
+    ) -> Tuple[np.ndarray, List[Tuple[str, ...]], List[Tuple[str, ...]]]:
+        """Split the runs into chunks, one spawned generator each, across the shared pool
+        
+        The chunking depends only on the request, so the pool (or its absence on a
+        single CPU) changes where chunks run but never the result.
+        """
+        n_chunks = min(PARALLEL_CHUNKS, request.monte_carlo_runs)
+        chunk_runs = [len(chunk) for chunk in np.array_split(np.arange(request.monte_carlo_runs), n_chunks)]
+        rngs = self.rng.spawn(n_chunks)
+        pool = _get_process_pool()
+        if pool is None:
+            chunks = list(map(_simulate_run_chunk, repeat(request), chunk_runs, rngs))
+        else:
+            chunks = list(pool.map(_simulate_run_chunk, repeat(request), chunk_runs, rngs))
+        
+        # Names describe the first run, which lives in the first chunk
+        _, factor_names, shock_names = chunks[0]
+        return np.vstack([chunk[0] for chunk in chunks]), factor_names, shock_names
     
     def simulate_variance(
         self,
         request: VarianceSimulationRequest
     ) -> VarianceSimulationResponse:
-        """Run productivity variance simulation"""
-        start_time = datetime.now()
+        """Run productivity variance simulation
+        
+        All Monte Carlo runs are simulated together as a (runs, days) array.
+        Data points describe the first run; the statistics cover every run.
+        """
+        start_ns = time.perf_counter_ns()
         
         # Initialize
-        current_date = request.start_date
-        day_number = 0
-        total_days = (request.end_date - request.start_date).days + 1
-        data_points = []
-        
-        # Reset autocorrelation
-        self.previous_value = None
-        
-        # Generate data points for each day
-        while current_date <= request.end_date:
-            # Generate base variance
-            variance_value = self._generate_base_variance(request.profile, day_number)
-            
-            # Apply scenario pattern
-            variance_value = self._apply_scenario_pattern(
-                variance_value,
-                day_number,
-                total_days,
-                request.variance_scenario
-            )
-            
-            # Apply learning curve
-            variance_value = self._apply_learning_curve(
-                variance_value,
-                day_number,
-                request.profile
-            )
-            
-            # Apply temporal patterns
-            variance_value = self._apply_temporal_patterns(
-                variance_value,
-                current_date,
-                None,  # Could add hour-by-hour simulation
-                request.profile
-            )
-            
-            # Apply variance factors
-            variance_value, factor_names = self._apply_variance_factors(
-                variance_value,
-                request.variance_factors,
-                current_date
-            )
-            
-            # Apply shock events
-            variance_value, shock_names = self._apply_shock_events(
-                variance_value,
-                current_date,
-                request.shock_events
-            )
-            
-            # Calculate metrics
-            actual_units = request.baseline_units_per_hour * variance_value
-            variance_pct = ((variance_value - 1.0) * 100)
-            adjusted_staff = self._calculate_staffing_adjustment(
-                request.baseline_staff_needed,
-                variance_value
-            )
-            staffing_variance = adjusted_staff - request.baseline_staff_needed
-            
-            # Create data point
-            data_point = ProductivityDataPoint(
-                date=current_date.isoformat(),
+        total_days = request.total_days
+        runs = request.monte_carlo_runs
+        start_date = request.start_date
+        date_labels = [(start_date + timedelta(days=i)).isoformat() for i in range(total_days)]
+        
+        # Simulate every run and day, in parallel chunks for large Monte Carlo requests
+        if runs > 1 and runs * total_days > PARALLEL_CELL_THRESHOLD:
+            modifiers, factor_names, shock_names = self._simulate_modifiers_parallel(request)
+        else:
+            modifiers, factor_names, shock_names = self._simulate_modifiers(request, runs)
+        
+        # Calculate metrics for every run at once
+        variance_pct = (modifiers - 1.0) * 100
+        adjusted_staff = self._calculate_staffing_adjustment(request.baseline_staff_needed, modifiers)
+        staffing_variances = adjusted_staff - request.baseline_staff_needed
+        
+        # Create data points from the first run; every field comes from the engine,
+        # so the per-row validation is skipped
+        data_points = [
+            ProductivityDataPoint.model_construct(
+                date=date_label,
                 hour_of_day=None,
                 baseline_units_per_hour=request.baseline_units_per_hour,
-                actual_units_per_hour=round(actual_units, 2),
-                productivity_modifier=round(variance_value, 3),
-                variance_percentage=round(variance_pct, 2),
+                actual_units_per_hour=round(request.baseline_units_per_hour * modifier, 2),
+                productivity_modifier=round(modifier, 3),
+                variance_percentage=round(pct, 2),
                 baseline_staff_needed=request.baseline_staff_needed,
-                adjusted_staff_needed=adjusted_staff,
-                staffing_variance=staffing_variance,
-                contributing_factors=factor_names + shock_names
+                adjusted_staff_needed=staff,
+                staffing_variance=staff - request.baseline_staff_needed,
+                contributing_factors=factors + shocks if shocks else factors
             )
-            data_points.append(data_point)
-            
-            # Next day
-            current_date += timedelta(days=1)
-            day_number += 1
-        
-        # Calculate statistics
-        productivity_values = [dp.productivity_modifier for dp in data_points]
-        variance_values = [dp.variance_percentage for dp in data_points]
-        staffing_variances = [dp.staffing_variance for dp in data_points]
+            for date_label, modifier, pct, staff, factors, shocks in zip(
+                date_labels,
+                modifiers[0].tolist(),
+                variance_pct[0].tolist(),
+                adjusted_staff[0].tolist(),
+                factor_names,
+                shock_names
+            )
+        ]
+        
+        # Calculate statistics straight from the float32 run arrays over all runs;
+        # ravel of the contiguous arrays is a view, not a copy
+        productivity_values = np.round(modifiers, 3).ravel()
+        variance_values = np.round(variance_pct, 2).ravel()
+        # Day counts are taken per run (axis 1) before averaging across runs
+        run_understaffed = staffing_variances > 0
+        run_overstaffed = staffing_variances < 0
+        run_extra_staff = np.maximum(staffing_variances, 0).sum(axis=1)
+        staffing_variances = staffing_variances.ravel()
+        
+        productivity_mean = productivity_values.mean()
+        productivity_std = productivity_values.std()
+        # One sort-based pass for the median and every reported percentile
+        p25, median, p75, p90 = np.percentile(productivity_values, [25, 50, 75, 90])
         
         productivity_stats = {
-            "mean": float(np.mean(productivity_values)),
-            "median": float(np.median(productivity_values)),
-            "std_dev": float(np.std(productivity_values)),
-            "min": float(np.min(productivity_values)),
-            "max": float(np.max(productivity_values)),
-            "percentile_25": float(np.percentile(productivity_values, 25)),
-            "percentile_75": float(np.percentile(productivity_values, 75)),
-            "percentile_90": float(np.percentile(productivity_values, 90)),
+            "mean": _as_float(productivity_mean),
+            "median": _as_float(median),
+            "std_dev": _as_float(productivity_std),
+            "min": _as_float(productivity_values.min()),
+            "max": _as_float(productivity_values.max()),
+            "percentile_25": _as_float(p25),
+            "percentile_75": _as_float(p75),
+            "percentile_90": _as_float(p90),
         }
         
         staffing_impact = {
-            "avg_variance": float(np.mean(staffing_variances)),
-            "max_additional_staff": int(max(staffing_variances)),
-            "min_additional_staff": int(min(staffing_variances)),
-            "total_additional_staff_days": int(sum(max(0, sv) for sv in staffing_variances)),
-            "days_understaffed": int(sum(1 for sv in staffing_variances if sv > 0)),
-            "days_overstaffed": int(sum(1 for sv in staffing_variances if sv < 0)),
+            "avg_variance": _as_float(staffing_variances.mean()),
+            "max_additional_staff": int(staffing_variances.max()),
+            "min_additional_staff": int(staffing_variances.min()),
+            "total_additional_staff_days": int(round(run_extra_staff.mean())),
+            "days_understaffed": int(round(run_understaffed.sum(axis=1).mean())),
+            "days_overstaffed": int(round(run_overstaffed.sum(axis=1).mean())),
         }
         
         # Risk metrics
-        days_low_productivity = sum(1 for pv in productivity_values if pv < 0.9)
-        days_critical_productivity = sum(1 for pv in productivity_values if pv < 0.8)
-        
         risk_metrics = {
-            "probability_below_90pct": float(days_low_productivity / len(productivity_values)),
-            "probability_below_80pct": float(days_critical_productivity / len(productivity_values)),
-            "volatility": float(np.std(variance_values)),
-            "coefficient_of_variation": float(np.std(productivity_values) / np.mean(productivity_values)),
+            "probability_below_90pct": _as_float((productivity_values < 0.9).mean()),
+            "probability_below_80pct": _as_float((productivity_values < 0.8).mean()),
+            "volatility": _as_float(variance_values.std()),
+            "coefficient_of_variation": _as_float(productivity_std / productivity_mean),
         }
         
         # Confidence intervals (for monte carlo, would need multiple runs)
+        lo_q = (1 - request.confidence_level) * 50
+        hi_q = 100 - lo_q
+        productivity_lo, productivity_hi = np.percentile(productivity_values, [lo_q, hi_q])
+        staffing_lo, staffing_hi = np.percentile(staffing_variances, [lo_q, hi_q])
         confidence_intervals = {
             "productivity_modifier": {
-                "lower": float(np.percentile(productivity_values, (1 - request.confidence_level) * 50)),
-                "upper": float(np.percentile(productivity_values, 100 - (1 - request.confidence_level) * 50)),
+                "lower": _as_float(productivity_lo),
+                "upper": _as_float(productivity_hi),
             },
             "staffing_variance": {
-                "lower": float(np.percentile(staffing_variances, (1 - request.confidence_level) * 50)),
-                "upper": float(np.percentile(staffing_variances, 100 - (1 - request.confidence_level) * 50)),
+                "lower": _as_float(staffing_lo),
+                "upper": _as_float(staffing_hi),
             }
         }
         
         # Calculate execution time
-        end_time = datetime.now()
-        duration_ms = (end_time - start_time).total_seconds() * 1000
+        duration_ms = (time.perf_counter_ns() - start_ns) / 1e6
         
-        return VarianceSimulationResponse(
+        response = VarianceSimulationResponse(
             organization_id=request.organization_id,
             variance_scenario=request.variance_scenario.value,
             start_date=request.start_date.isoformat(),
@@ -493,66 +663,86 @@ class ProductivityVarianceEngine:
             execution_duration_ms=round(duration_ms, 2),
             seed_used=request.seed
         )
+        # Copy the row so the response does not pin every run's modifiers
+        response._modifiers = modifiers[0].copy()
+        return response
 
 
 # ============================================================================
 # Convenience Functions
 # ============================================================================
 
+# Presets are validated once at import; create_preset_profile hands out copies
+_PRESET_PROFILES = {
+    VarianceScenario.CONSISTENT: ProductivityVarianceProfile(
+        mean_productivity_modifier=1.0,
+        std_deviation=0.05,
+        min_modifier=0.90,
+        max_modifier=1.10,
+        autocorrelation=0.7
+    ),
+    VarianceScenario.VOLATILE: ProductivityVarianceProfile(
+        mean_productivity_modifier=1.0,
+        std_deviation=0.25,
+        min_modifier=0.60,
+        max_modifier=1.40,
+        autocorrelation=0.3
+    ),
+    VarianceScenario.DECLINING: ProductivityVarianceProfile(
+        mean_productivity_modifier=1.0,
+        std_deviation=0.10,
+        min_modifier=0.70,
+        max_modifier=1.10,
+    ),
+    VarianceScenario.IMPROVING: ProductivityVarianceProfile(
+        mean_productivity_modifier=0.9,
+        std_deviation=0.10,
+        min_modifier=0.80,
+        max_modifier=1.20,
+        learning_curve_enabled=True,
+        learning_rate=0.005
+    ),
+    VarianceScenario.CYCLICAL: ProductivityVarianceProfile(
+        mean_productivity_modifier=1.0,
+        std_deviation=0.10,
+        min_modifier=0.85,
+        max_modifier=1.15,
+        day_of_week_impact={0: 0.9, 1: 0.95, 2: 1.0, 3: 1.05, 4: 1.1, 5: 0.85, 6: 0.80}
+    ),
+    VarianceScenario.SHOCK: ProductivityVarianceProfile(
+        mean_productivity_modifier=1.0,
+        std_deviation=0.15,
+        min_modifier=0.50,
+        max_modifier=1.20,
+        autocorrelation=0.5
+    ),
+}
+
+
+_DEFAULT_PROFILE = ProductivityVarianceProfile()
+
+
 def create_preset_profile(scenario: VarianceScenario) -> ProductivityVarianceProfile:
     """Create a preset variance profile for common scenarios"""
+    return _PRESET_PROFILES.get(scenario, _DEFAULT_PROFILE).model_copy(deep=True)
+
+
+def _describe_factor(factor: ProductivityVarianceFactor) -> str:
+    """Generate description for a variance factor"""
+    impact_dir = "decreases" if factor.impact_magnitude < 0 else "increases"
+    impact_pct = abs(factor.impact_magnitude * 100)
+    prob_pct = factor.probability * 100
     
-    presets = {
-        VarianceScenario.CONSISTENT: ProductivityVarianceProfile(
-            mean_productivity_modifier=1.0,
-            std_deviation=0.05,
-            min_modifier=0.90,
-            max_modifier=1.10,
-            autocorrelation=0.7
-        ),
-        VarianceScenario.VOLATILE: ProductivityVarianceProfile(
-            mean_productivity_modifier=1.0,
-            std_deviation=0.25,
-            min_modifier=0.60,
-            max_modifier=1.40,
-            autocorrelation=0.3
-        ),
-        VarianceScenario.DECLINING: ProductivityVarianceProfile(
-            mean_productivity_modifier=1.0,
-            std_deviation=0.10,
-            min_modifier=0.70,
-            max_modifier=1.10,
-        ),
-        VarianceScenario.IMPROVING: ProductivityVarianceProfile(
-            mean_productivity_modifier=0.9,
-            std_deviation=0.10,
-            min_modifier=0.80,
-            max_modifier=1.20,
-            learning_curve_enabled=True,
-            learning_rate=0.005
-        ),
-        VarianceScenario.CYCLICAL: ProductivityVarianceProfile(
-            mean_productivity_modifier=1.0,
-            std_deviation=0.10,
-            min_modifier=0.85,
-            max_modifier=1.15,
-            day_of_week_impact={0: 0.9, 1: 0.95, 2: 1.0, 3: 1.05, 4: 1.1, 5: 0.85, 6: 0.80}
-        ),
-        VarianceScenario.SHOCK: ProductivityVarianceProfile(
-            mean_productivity_modifier=1.0,
-            std_deviation=0.15,
-            min_modifier=0.50,
-            max_modifier=1.20,
-            autocorrelation=0.5
-        ),
-    }
-    
-    return presets.get(scenario, ProductivityVarianceProfile())
+    return (
+        f"{factor.category.value.title()} factor that {impact_dir} productivity by "
+        f"{impact_pct:.0f}%. Occurs {prob_pct:.0f}% of the time for approximately "
+        f"{factor.duration_hours} hours."
+    )
 
 
 def create_common_factors() -> List[ProductivityVarianceFactor]:
     """Create a list of common productivity variance factors"""
-    return [
+    factors = [
         ProductivityVarianceFactor(
             name="Equipment Downtime",
             category=FactorCategory.EQUIPMENT,
@@ -582,3 +772,9 @@ def create_common_factors() -> List[ProductivityVarianceFactor]:
             duration_hours=24
         ),
     ]
+    
+    # Descriptions depend only on immutable factor fields, so format them once here
+    for factor in factors:
+        factor.description = _describe_factor(factor)
+    
+    return factors
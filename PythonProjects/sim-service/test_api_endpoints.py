@@ -3,12 +3,62 @@
 Comprehensive API Endpoint Test Suite
 Tests all sim-service endpoints with realistic scenarios
 """
-import requests
-import json
+import asyncio
+import hashlib
+import importlib.util
+import os
+from pathlib import Path
+import httpx
+import orjson
 from datetime import date, timedelta
 import time
 
 BASE_URL = "http://localhost:8000"
+JSON_HEADERS = {"Content-Type": "application/json"}
+# HTTP/2 multiplexing needs the optional h2 package (httpx[http2])
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+# Read-only replies are kept on disk between runs; REFRESH_FIXTURES=1 bypasses them
+FIXTURE_DIR = Path(__file__).with_name(".test_fixtures")
+FIXTURE_TTL_SECONDS = float(os.environ.get("FIXTURE_TTL_SECONDS", 300))
+REFRESH_FIXTURES = os.environ.get("REFRESH_FIXTURES") == "1"
+
+# With SIM_DEBUG_BATCH=1 (set for the server too) the read-only endpoints are
+# fetched through one /debug/batch round trip instead of one call each
+DEBUG_BATCH = os.environ.get("SIM_DEBUG_BATCH") == "1"
+READ_ONLY_PATHS = {
+    "root": "/",
+    "health": "/health",
+    "stats": "/sim/stats",
+    "scenarios": "/sim/scenarios",
+    "presets": "/sim/productivity/presets",
+    "factors": "/sim/productivity/factors",
+    "overflow_strategies": "/sim/backlog/overflow-strategies",
+    "profile_templates": "/sim/backlog/profile-templates",
+}
+
+# Every day of the backlog request shares the same capacity and demand shape
+BACKLOG_DAYS = 14
+CAPACITY_TEMPLATE = {
+    "total_capacity_hours": 40.0,
+    "backlog_capacity_hours": 24.0,
+    "new_work_capacity_hours": 16.0,
+    "staff_count": 10,
+    "productivity_modifier": 1.0,
+    "max_items_per_day": 100,
+    "max_complex_items_per_day": 10
+}
+PRIORITY_TEMPLATE = {
+    "low": 20,
+    "medium": 15,
+    "high": 10,
+    "critical": 5
+}
+COMPLEXITY_TEMPLATE = {
+    "simple": 25,
+    "moderate": 17,
+    "complex": 8
+}
 
 def print_section(title):
     """Print a formatted section header"""
@@ -16,21 +66,83 @@ def print_section(title):
     print(f"  {title}")
     print('='*70)
 
-def test_endpoint(method, path, data=None, params=None):
-    """Test a single endpoint and print results"""
-    url = f"{BASE_URL}{path}"
+def fixture_path(method, path, params):
+    """On-disk fixture location for a request, keyed by method, path and params"""
+    query = sorted(params.items()) if params else ""
+    key = hashlib.blake2b(f"{method}{path}{query}".encode(), digest_size=16).hexdigest()
+    return FIXTURE_DIR / f"{key}.json"
+
+async def cached(request, fixture):
+    """Serve a fresh fixture from disk, or await the request and store a 200 reply"""
+    if (
+        not REFRESH_FIXTURES
+        and fixture.exists()
+        and time.time() - fixture.stat().st_mtime < FIXTURE_TTL_SECONDS
+    ):
+        request.close()
+        stored = orjson.loads(fixture.read_bytes())
+        return httpx.Response(stored["status_code"], content=stored["content"].encode())
+    
+    response = await request
+    if response.status_code == 200:
+        FIXTURE_DIR.mkdir(exist_ok=True)
+        fixture.write_bytes(orjson.dumps({"status_code": response.status_code, "content": response.text}))
+    return response
+
+def send(client, method, path, data=None, params=None):
+    """Start a request right away so independent calls overlap on the wire"""
+    if method == "GET":
+        request = client.get(path, params=params)
+    else:
+        body = orjson.dumps(data) if data is not None else None
+        request = client.post(path, content=body, params=params, headers=JSON_HEADERS)
+    
+    # GETs and seeded body-less POSTs are deterministic, so safe to replay;
+    # unseeded simulations would replay one random draw
+    if method == "GET" or (params and "seed" in params and data is None):
+        request = cached(request, fixture_path(method, path, params))
+    return asyncio.ensure_future(request)
+
+async def fetch_batch(client, paths):
+    """GET several paths through /debug/batch; None when the gateway is off"""
+    body = orjson.dumps({"calls": [{"method": "GET", "path": path} for path in paths.values()]})
+    response = await client.post("/debug/batch", content=body, headers=JSON_HEADERS)
+    if response.status_code != 200:
+        return None
+    results = orjson.loads(response.content)["results"]
+    return {
+        name: httpx.Response(result["status_code"], content=orjson.dumps(result["body"]))
+        for name, result in zip(paths, results)
+    }
+
+async def from_batch(batch, client, name, path):
+    """Take one reply from a shared batch, falling back to a direct GET"""
+    replies = await batch
+    if replies is None:
+        return await send(client, "GET", path)
+    return replies[name]
+
+def send_read_only(client):
+    """Start every read-only request, batched into one call when enabled"""
+    if not DEBUG_BATCH:
+        return {name: send(client, "GET", path) for name, path in READ_ONLY_PATHS.items()}
+    batch = asyncio.ensure_future(fetch_batch(client, READ_ONLY_PATHS))
+    return {
+        name: asyncio.ensure_future(from_batch(batch, client, name, path))
+        for name, path in READ_ONLY_PATHS.items()
+    }
+
+async def test_endpoint(method, path, pending):
+    """Await an in-flight request for a single endpoint and print results"""
     print(f"\n🔍 Testing: {method} {path}")
     
     try:
-        if method == "GET":
-            response = requests.get(url, params=params, timeout=10)
-        else:
-            response = requests.post(url, json=data, params=params, timeout=10)
+        response = await pending
         
         print(f"✅ Status: {response.status_code}")
         
         if response.status_code == 200:
-            result = response.json()
+            result = orjson.loads(response.content)
             # Print compact result preview
             if isinstance(result, dict):
                 keys = list(result.keys())[:5]
@@ -46,20 +158,107 @@ def test_endpoint(method, path, data=None, params=None):
         print(f"❌ Exception: {str(e)}")
         return None
 
-def main():
-    print_section("SIM-SERVICE API TEST SUITE")
-    print(f"Testing endpoint: {BASE_URL}")
-    print(f"Timestamp: {date.today()}")
+async def stream_ndjson(client, path, data):
+    """POST a request and fold an NDJSON reply into one result as lines arrive"""
+    result = {"total_days": 0, "streamed_days": 0, "streamed_items": 0}
+    async with client.stream("POST", path, content=orjson.dumps(data), headers=JSON_HEADERS) as response:
+        if response.status_code != 200:
+            await response.aread()
+            return response, None
+        async for line in response.aiter_lines():
+            if not line:
+                continue
+            record = orjson.loads(line)
+            kind = record.pop("type")
+            if kind == "day":
+                result["streamed_days"] += 1
+            elif kind == "item":
+                result["streamed_items"] += 1
+            else:
+                result.update(record)
+    return response, result
+
+def window_dates(start_date):
+    """ISO labels for every day of the test window, formatted once up front"""
+    return [(start_date + timedelta(days=i)).isoformat() for i in range(BACKLOG_DAYS + 1)]
+
+def build_variance_request(dates):
+    """Full productivity variance simulation request"""
+    return {
+        "organization_id": "test-org-001",
+        "start_date": dates[0],
+        "end_date": dates[-1],
+        "profile": {
+            "mean_productivity_modifier": 1.0,
+            "std_deviation": 0.15,
+            "min_modifier": 0.7,
+            "max_modifier": 1.3,
+            "distribution_type": "normal",
+            "autocorrelation": 0.6
+        },
+        "labor_standards": {
+            "baseline_units_per_hour": 8.5,
+            "baseline_staff_count": 10,
+            "shift_hours": 8,
+            "target_service_level": 0.95
+        },
+        "variance_factors": [],
+        "monte_carlo_runs": 100,
+        "seed": 42
+    }
+
+def build_backlog_request(dates):
+    """Full backlog propagation request with BACKLOG_DAYS of capacities and demands"""
+    work_days = dates[:BACKLOG_DAYS]
     
+    # Generate capacities and demands
+    capacities = [{"date": day, **CAPACITY_TEMPLATE} for day in work_days]
+    demands = [
+        {
+            "date": day,
+            "new_items_by_priority": PRIORITY_TEMPLATE,
+            "new_items_by_complexity": COMPLEXITY_TEMPLATE,
+            "total_estimated_effort_hours": 25.0
+        }
+        for day in work_days
+    ]
+    
+    return {
+        "organization_id": "test-org-001",
+        "start_date": dates[0],
+        "end_date": dates[-1],
+        "profile": {
+            "propagation_rate": 1.0,
+            "decay_rate": 0.05,
+            "max_backlog_capacity": 500,
+            "aging_enabled": True,
+            "aging_threshold_days": 3,
+            "overflow_strategy": "defer",
+            "sla_breach_threshold_days": 2,
+            "sla_penalty_per_day": 100.0,
+            "customer_satisfaction_impact": -0.05,
+            "recovery_rate_multiplier": 1.0,
+            "recovery_priority_boost": 1
+        },
+        "initial_backlog_items": [],
+        "daily_capacities": capacities,
+        "daily_demands": demands,
+        "seed": 42,
+        "enable_priority_aging": True,
+        "enable_sla_tracking": True
+    }
+
+async def report_results(pending):
+    """Await every in-flight request and print the results section by section"""
     # =========================================================================
     # BASIC ENDPOINTS
     # =========================================================================
     print_section("1. BASIC HEALTH & INFO ENDPOINTS")
     
-    test_endpoint("GET", "/")
-    test_endpoint("GET", "/health")
-    test_endpoint("GET", "/sim/stats")
-    test_endpoint("GET", "/sim/scenarios")
+    await test_endpoint("GET", "/", pending["root"])
+    await test_endpoint("GET", "/health", pending["health"])
+    await test_endpoint("GET", "/sim/stats", pending["stats"])
+    await test_endpoint("GET", "/sim/scenarios", pending["scenarios"])
     
     # =========================================================================
     # PRODUCTIVITY VARIANCE ENDPOINTS
@@ -67,22 +266,17 @@ def main():
     print_section("2. PRODUCTIVITY VARIANCE ENDPOINTS")
     
     # Get presets
-    test_endpoint("GET", "/sim/productivity/presets")
+    await test_endpoint("GET", "/sim/productivity/presets", pending["presets"])
     
     # Get factors
-    test_endpoint("GET", "/sim/productivity/factors")
+    await test_endpoint("GET", "/sim/productivity/factors", pending["factors"])
     
     # Quick analysis
     print("\n📊 Running quick productivity analysis...")
-    quick_analysis_result = test_endpoint(
+    quick_analysis_result = await test_endpoint(
         "POST",
         "/sim/productivity/quick-analysis",
-        params={
-            "scenario": "consistent",
-            "days": 30,
-            "baseline_units_per_hour": 8.5,
-            "baseline_staff": 10
-        }
+        pending["quick_analysis"]
     )
     
     if quick_analysis_result:
@@ -98,36 +292,10 @@ def main():
     # Full variance simulation
     print("\n📊 Running full productivity variance simulation...")
     
-    start_date = date.today()
-    end_date = start_date + timedelta(days=14)
-    
-    variance_request = {
-        "organization_id": "test-org-001",
-        "start_date": start_date.isoformat(),
-        "end_date": end_date.isoformat(),
-        "profile": {
-            "mean_productivity_modifier": 1.0,
-            "std_deviation": 0.15,
-            "min_modifier": 0.7,
-            "max_modifier": 1.3,
-            "distribution_type": "normal",
-            "autocorrelation": 0.6
-        },
-        "labor_standards": {
-            "baseline_units_per_hour": 8.5,
-            "baseline_staff_count": 10,
-            "shift_hours": 8,
-            "target_service_level": 0.95
-        },
-        "variance_factors": [],
-        "monte_carlo_runs": 100,
-        "seed": 42
-    }
-    
-    variance_result = test_endpoint(
+    variance_result = await test_endpoint(
         "POST",
         "/sim/productivity/variance",
-        data=variance_request
+        pending["variance"]
     )
     
     if variance_result:
@@ -149,24 +317,17 @@ def main():
     print_section("3. BACKLOG PROPAGATION ENDPOINTS")
     
     # Get overflow strategies
-    test_endpoint("GET", "/sim/backlog/overflow-strategies")
+    await test_endpoint("GET", "/sim/backlog/overflow-strategies", pending["overflow_strategies"])
     
     # Get profile templates
-    test_endpoint("GET", "/sim/backlog/profile-templates")
+    await test_endpoint("GET", "/sim/backlog/profile-templates", pending["profile_templates"])
     
     # Quick scenarios
     print("\n📊 Running quick backlog scenarios...")
-    quick_backlog_result = test_endpoint(
+    quick_backlog_result = await test_endpoint(
         "POST",
         "/sim/backlog/quick-scenarios",
-        params={
-            "organization_id": "test-org-001",
-            "start_date": start_date.isoformat(),
-            "days": 30,
-            "daily_demand_count": 50,
-            "daily_capacity_hours": 40,
-            "initial_backlog_count": 25
-        }
+        pending["quick_backlog"]
     )
     
     if quick_backlog_result:
@@ -181,74 +342,20 @@ def main():
     # Full backlog propagation
     print("\n📊 Running full backlog propagation simulation...")
     
-    # Generate capacities and demands
-    capacities = []
-    demands = []
-    
-    for day_offset in range(14):
-        day = start_date + timedelta(days=day_offset)
-        
-        capacities.append({
-            "date": day.isoformat(),
-            "total_capacity_hours": 40.0,
-            "backlog_capacity_hours": 24.0,
-            "new_work_capacity_hours": 16.0,
-            "staff_count": 10,
-            "productivity_modifier": 1.0,
-            "max_items_per_day": 100,
-            "max_complex_items_per_day": 10
-        })
-        
-        demands.append({
-            "date": day.isoformat(),
-            "new_items_by_priority": {
-                "low": 20,
-                "medium": 15,
-                "high": 10,
-                "critical": 5
-            },
-            "new_items_by_complexity": {
-                "simple": 25,
-                "moderate": 17,
-                "complex": 8
-            },
-            "total_estimated_effort_hours": 25.0
-        })
-    
-    backlog_request = {
-        "organization_id": "test-org-001",
-        "start_date": start_date.isoformat(),
-        "end_date": end_date.isoformat(),
-        "profile": {
-            "propagation_rate": 1.0,
-            "decay_rate": 0.05,
-            "max_backlog_capacity": 500,
-            "aging_enabled": True,
-            "aging_threshold_days": 3,
-            "overflow_strategy": "defer",
-            "sla_breach_threshold_days": 2,
-            "sla_penalty_per_day": 100.0,
-            "customer_satisfaction_impact": -0.05,
-            "recovery_rate_multiplier": 1.0,
-            "recovery_priority_boost": 1
-        },
-        "initial_backlog_items": [],
-        "daily_capacities": capacities,
-        "daily_demands": demands,
-        "seed": 42,
-        "enable_priority_aging": True,
-        "enable_sla_tracking": True
-    }
-    
-    backlog_result = test_endpoint(
-        "POST",
-        "/sim/backlog/propagate",
-        data=backlog_request
-    )
+    print("\n🔍 Testing: POST /sim/backlog/propagate/stream")
+    try:
+        response, backlog_result = await pending["backlog"]
+        print(f"✅ Status: {response.status_code}")
+        if backlog_result is None:
+            print(f"❌ Error: {response.text}")
+    except Exception as e:
+        print(f"❌ Exception: {str(e)}")
+        backlog_result = None
     
     if backlog_result:
         print("\n📈 Backlog Propagation Results:")
         print(f"   Total days: {backlog_result.get('total_days')}")
+        print(f"   Streamed snapshots: {backlog_result.get('streamed_days')}")
         print(f"   Final backlog: {backlog_result.get('final_backlog_count')}")
         if 'summary_stats' in backlog_result:
             stats = backlog_result['summary_stats']
@@ -271,6 +378,62 @@ def main():
     print("  - Total: 12 endpoints")
     print("\nDocumentation: http://localhost:8000/docs")
     print("OpenAPI Schema: http://localhost:8000/openapi.json")
+
+async def main():
+    print_section("SIM-SERVICE API TEST SUITE")
+    print(f"Testing endpoint: {BASE_URL}")
+    print(f"Timestamp: {date.today()}")
+    
+    dates = window_dates(date.today())
+    
+    async with httpx.AsyncClient(
+        base_url=BASE_URL,
+        timeout=10.0,
+        limits=httpx.Limits(max_keepalive_connections=8, max_connections=16),
+        http2=HTTP2_AVAILABLE
+    ) as client:
+        # No call depends on another's result, so every request is started up
+        # front and the sections below only await and report them in order
+        pending = {
+            **send_read_only(client),
+            "quick_analysis": send(
+                client,
+                "POST",
+                "/sim/productivity/quick-analysis",
+                params={
+                    "scenario": "consistent",
+                    "days": 30,
+                    "baseline_units_per_hour": 8.5,
+                    "baseline_staff": 10
+                }
+            ),
+            "variance": send(
+                client,
+                "POST",
+                "/sim/productivity/variance",
+                data=build_variance_request(dates)
+            ),
+            "quick_backlog": send(
+                client,
+                "POST",
+                "/sim/backlog/quick-scenarios",
+                params={
+                    "organization_id": "test-org-001",
+                    "start_date": dates[0],
+                    "days": 30,
+                    "daily_demand_count": 50,
+                    "daily_capacity_hours": 40,
+                    "initial_backlog_count": 25
+                }
+            ),
+            "backlog": asyncio.ensure_future(stream_ndjson(
+                client,
+                "/sim/backlog/propagate/stream",
+                build_backlog_request(dates)
+            )),
+        }
+        
+        await report_results(pending)
     
 if __name__ == "__main__":
-    main()
+    asyncio.run(main())
@@ -2,7 +2,7 @@
 
 import os
 from enum import Enum
-from typing import List
+from functools import cached_property, lru_cache
 
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -44,10 +44,12 @@ class Settings(BaseSettings):
     # API Keys (example - uncomment when needed)
     # api_key: str = ""
 
-    @property
-    def cors_origins_list(self) -> List[str]:
-        """Parse CORS origins into a list"""
-        return [origin.strip() for origin in self.python_cors_origins.split(",")]
+    @cached_property
+    def cors_origins_list(self) -> tuple[str, ...]:
+        """Parse CORS origins once into an immutable tuple"""
+        return tuple(
+            origin.strip() for origin in self.python_cors_origins.split(",") if origin.strip()
+        )
 
     @property
     def is_development(self) -> bool:
@@ -65,5 +67,11 @@ class Settings(BaseSettings):
         return self.python_env == Environment.TEST
 
 
+@lru_cache
+def get_settings() -> Settings:
+    """Return the process-wide settings, reading the environment only once"""
+    return Settings()
+
+
 # Create global settings instance
-settings = Settings()
+settings = get_settings()
@@ -1,6 +1,7 @@
 """Main FastAPI application"""
 
-from fastapi import FastAPI
+import orjson
+from fastapi import FastAPI, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
 
 from config import settings
@@ -12,40 +13,56 @@ app = FastAPI(
     debug=settings.is_development,
 )
 
-# Configure CORS
+# Configure CORS - CORSMiddleware tests membership in allow_origins on every
+# request, so hand it a set rather than a sequence
+_CORS_ORIGINS = frozenset(settings.cors_origins_list)
+
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=settings.cors_origins_list,
+    allow_origins=_CORS_ORIGINS,
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
 )
 
+# Bodies below never change for the life of the process, so encode them once
+_ROOT_BYTES = orjson.dumps(
+    {
+        "message": "Staffing Flow Python API",
+        "status": "running",
+        "environment": settings.python_env.value,
+    }
+)
+_HEALTH_BYTES = orjson.dumps({"status": "healthy", "environment": settings.python_env.value})
+# Sample data - replace with actual database queries
+_STAFF_BYTES = orjson.dumps(
+    [
+        {"id": 1, "name": "John Doe", "role": "Developer", "status": "active"},
+        {"id": 2, "name": "Jane Smith", "role": "Designer", "status": "active"},
+    ]
+)
+
 
 @app.get("/")
 async def root():
     """Root endpoint"""
-    return {
-        "message": "Staffing Flow Python API",
-        "status": "running",
-        "environment": settings.python_env,
-    }
+    return Response(content=_ROOT_BYTES, media_type="application/json")
 
 
-@app.get("/health")
-async def health_check():
+async def health_check(request: Request) -> Response:
     """Health check endpoint"""
-    return {"status": "healthy", "environment": settings.python_env}
+    return Response(content=_HEALTH_BYTES, media_type="application/json")
+
+
+# Probes hit /health constantly, so it is a plain Starlette route: no parameter
+# parsing or response handling, at the cost of not appearing in the OpenAPI docs
+app.add_route("/health", health_check, methods=["GET"])
 
 
 @app.get("/api/staff")
 async def get_staff():
     """Get staff list"""
-    # Sample data - replace with actual database queries
-    return [
-        {"id": 1, "name": "John Doe", "role": "Developer", "status": "active"},
-        {"id": 2, "name": "Jane Smith", "role": "Designer", "status": "active"},
-    ]
+    return Response(content=_STAFF_BYTES, media_type="application/json")
 
 
 if __name__ == "__main__":
@@ -8,13 +8,20 @@ from python.rbac.types import (
     PermissionContext,
     PermissionCheckResult,
     ROLE_PERMISSIONS,
+    ROLE_PERMISSION_SETS,
+    PERMISSION_BIT,
+    ROLE_PERMISSION_MASKS,
+    OWN_SCOPED_PERMISSIONS,
+    TEAM_SCOPED_PERMISSIONS,
 )
 
 from python.rbac.utils import (
+    permissions_to_mask,
     role_has_permission,
     role_has_any_permission,
     role_has_all_permissions,
     has_permission,
+    has_permission_bulk,
     has_any_permission,
     has_all_permissions,
     has_role,
@@ -34,10 +41,17 @@ __all__ = [
     "PermissionContext",
     "PermissionCheckResult",
     "ROLE_PERMISSIONS",
+    "ROLE_PERMISSION_SETS",
+    "PERMISSION_BIT",
+    "ROLE_PERMISSION_MASKS",
+    "OWN_SCOPED_PERMISSIONS",
+    "TEAM_SCOPED_PERMISSIONS",
+    "permissions_to_mask",
     "role_has_permission",
     "role_has_any_permission",
     "role_has_all_permissions",
     "has_permission",
+    "has_permission_bulk",
     "has_any_permission",
     "has_all_permissions",
     "has_role",
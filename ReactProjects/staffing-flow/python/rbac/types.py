@@ -1,7 +1,7 @@
 """RBAC Type Definitions for Python Backend"""
 
 from enum import Enum
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from datetime import datetime
 from pydantic import BaseModel, Field
 
@@ -85,10 +85,10 @@ class PermissionScope(str, Enum):
     SELF = "self"
 
 
-# Role permissions mapping
-ROLE_PERMISSIONS: dict[UserRole, List[Permission]] = {
-    UserRole.SUPER_ADMIN: [p for p in Permission],  # All permissions
-    UserRole.ADMIN: [
+# Role permissions mapping (immutable, so callers can't alter a role's grants)
+ROLE_PERMISSIONS: dict[UserRole, Tuple[Permission, ...]] = {
+    UserRole.SUPER_ADMIN: tuple(Permission),  # All permissions
+    UserRole.ADMIN: (
         Permission.USER_CREATE,
         Permission.USER_READ,
         Permission.USER_UPDATE,
@@ -128,8 +128,8 @@ ROLE_PERMISSIONS: dict[UserRole, List[Permission]] = {
         Permission.SETTINGS_VIEW,
         Permission.AUDIT_READ,
         Permission.AUDIT_EXPORT,
-    ],
-    UserRole.MANAGER: [
+    ),
+    UserRole.MANAGER: (
         Permission.STAFF_READ_OWN,
         Permission.STAFF_READ_TEAM,
         Permission.STAFF_UPDATE_OWN,
@@ -146,8 +146,8 @@ ROLE_PERMISSIONS: dict[UserRole, List[Permission]] = {
         Permission.REPORT_VIEW,
         Permission.REPORT_EXPORT,
         Permission.SETTINGS_VIEW,
-    ],
-    UserRole.STAFF: [
+    ),
+    UserRole.STAFF: (
         Permission.STAFF_READ_OWN,
         Permission.STAFF_UPDATE_OWN,
         Permission.SCHEDULE_READ_OWN,
@@ -156,8 +156,8 @@ ROLE_PERMISSIONS: dict[UserRole, List[Permission]] = {
         Permission.TIMEOFF_CANCEL,
         Permission.DEPARTMENT_READ,
         Permission.SETTINGS_VIEW,
-    ],
-    UserRole.VIEWER: [
+    ),
+    UserRole.VIEWER: (
         Permission.STAFF_READ,
         Permission.STAFF_EXPORT,
         Permission.SCHEDULE_READ,
@@ -166,9 +166,32 @@ ROLE_PERMISSIONS: dict[UserRole, List[Permission]] = {
         Permission.REPORT_VIEW,
         Permission.REPORT_EXPORT,
         Permission.SETTINGS_VIEW,
-    ],
+    ),
 }
 
+# O(1) membership view of ROLE_PERMISSIONS; the tuples above keep their order
+ROLE_PERMISSION_SETS: dict[UserRole, frozenset[Permission]] = {
+    role: frozenset(permissions) for role, permissions in ROLE_PERMISSIONS.items()
+}
+
+# One bit per permission, so a set of permissions packs into a single int
+PERMISSION_BIT: dict[Permission, int] = {
+    permission: 1 << index for index, permission in enumerate(Permission)
+}
+
+ROLE_PERMISSION_MASKS: dict[UserRole, int] = {
+    role: sum(PERMISSION_BIT[permission] for permission in permissions)
+    for role, permissions in ROLE_PERMISSION_SETS.items()
+}
+
+# Permissions limited to the caller's own or team's resources, by naming convention
+OWN_SCOPED_PERMISSIONS: frozenset[Permission] = frozenset(
+    permission for permission in Permission if ".own" in permission.value
+)
+TEAM_SCOPED_PERMISSIONS: frozenset[Permission] = frozenset(
+    permission for permission in Permission if ".team" in permission.value
+)
+
 
 class User(BaseModel):
     """User model"""
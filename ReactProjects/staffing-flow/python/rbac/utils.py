@@ -1,60 +1,153 @@
 """RBAC Utilities for Python Backend"""
 
-from typing import List, Optional
+from functools import lru_cache
+from typing import Iterable, List, Optional, Sequence, Tuple, Union
 from python.rbac.types import (
     UserRole,
     Permission,
     ROLE_PERMISSIONS,
+    ROLE_PERMISSION_SETS,
+    PERMISSION_BIT,
+    ROLE_PERMISSION_MASKS,
+    OWN_SCOPED_PERMISSIONS,
+    TEAM_SCOPED_PERMISSIONS,
     PermissionContext,
     PermissionCheckResult,
 )
 
+# Rank of each role; a higher number outranks a lower one
+_ROLE_HIERARCHY = {
+    UserRole.SUPER_ADMIN: 5,
+    UserRole.ADMIN: 4,
+    UserRole.MANAGER: 3,
+    UserRole.STAFF: 2,
+    UserRole.VIEWER: 1,
+}
+
+_ROLE_DISPLAY_NAMES = {
+    UserRole.SUPER_ADMIN: "Super Admin",
+    UserRole.ADMIN: "Admin",
+    UserRole.MANAGER: "Manager",
+    UserRole.STAFF: "Staff",
+    UserRole.VIEWER: "Viewer",
+}
+
+
+# Roles each assigner may hand out; admins may assign anything below admin
+_ALL_ROLES: Tuple[UserRole, ...] = tuple(UserRole)
+_ADMIN_ASSIGNABLE_ROLES: Tuple[UserRole, ...] = (UserRole.MANAGER, UserRole.STAFF, UserRole.VIEWER)
+_ADMIN_ASSIGNABLE_ROLE_SET = frozenset(_ADMIN_ASSIGNABLE_ROLES)
+
 
 def role_has_permission(role: UserRole, permission: Permission) -> bool:
     """Check if a role has a specific permission"""
-    permissions = ROLE_PERMISSIONS.get(role, [])
-    return permission in permissions
+    return permission in ROLE_PERMISSION_SETS.get(role, frozenset())
+
+
+def permissions_to_mask(permissions: Iterable[Permission]) -> int:
+    """
+    Pack permissions into a bitmask
+    Callers checking a fixed list can build its mask once and pass the int
+    """
+    mask = 0
+    for permission in permissions:
+        mask |= PERMISSION_BIT[permission]
+    return mask
 
 
-def role_has_any_permission(role: UserRole, permissions: List[Permission]) -> bool:
-    """Check if a role has any of the specified permissions"""
-    return any(role_has_permission(role, perm) for perm in permissions)
+def role_has_any_permission(role: UserRole, permissions: Union[List[Permission], int]) -> bool:
+    """Check if a role has any of the specified permissions (list or mask)"""
+    if not isinstance(permissions, int):
+        permissions = permissions_to_mask(permissions)
+    return ROLE_PERMISSION_MASKS.get(role, 0) & permissions != 0
 
 
-def role_has_all_permissions(role: UserRole, permissions: List[Permission]) -> bool:
-    """Check if a role has all of the specified permissions"""
-    return all(role_has_permission(role, perm) for perm in permissions)
+def role_has_all_permissions(role: UserRole, permissions: Union[List[Permission], int]) -> bool:
+    """Check if a role has all of the specified permissions (list or mask)"""
+    if not isinstance(permissions, int):
+        permissions = permissions_to_mask(permissions)
+    return ROLE_PERMISSION_MASKS.get(role, 0) & permissions == permissions
 
 
-def has_permission(
-    context: PermissionContext, permission: Permission
-) -> PermissionCheckResult:
+@lru_cache(maxsize=4096)
+def _check_permission(
+    role: UserRole,
+    permission: Permission,
+    user_id: str,
+    team_id: Optional[str],
+    resource_owner_id: Optional[str],
+    resource_team_id: Optional[str],
+) -> Tuple[bool, Optional[str]]:
     """
-    Check if a user has a specific permission
-    Includes scope validation for team/self permissions
+    Permission check on plain hashable fields, memoized for repeated checks
+    Role permissions are fixed at import and the role is part of the key,
+    so a user whose role changes never gets a stale answer
     """
     # Check if role has the permission
-    if not role_has_permission(context.role, permission):
-        return PermissionCheckResult(
-            allowed=False, reason=f"Role {context.role} does not have permission {permission}"
-        )
+    if not role_has_permission(role, permission):
+        return False, f"Role {role} does not have permission {permission}"
 
     # Handle scope-based permissions
-    if ".own" in permission.value:
+    if permission in OWN_SCOPED_PERMISSIONS:
         # Self-scoped permission
-        if context.user_id != context.resource_owner_id:
-            return PermissionCheckResult(
-                allowed=False, reason="Can only access own resources"
-            )
+        if user_id != resource_owner_id:
+            return False, "Can only access own resources"
 
-    if ".team" in permission.value:
+    elif permission in TEAM_SCOPED_PERMISSIONS:
         # Team-scoped permission
-        if context.team_id != context.resource_team_id:
-            return PermissionCheckResult(
-                allowed=False, reason="Can only access team resources"
-            )
+        if team_id != resource_team_id:
+            return False, "Can only access team resources"
 
-    return PermissionCheckResult(allowed=True)
+    return True, None
+
+
+def has_permission(context: PermissionContext, permission: Permission) -> PermissionCheckResult:
+    """
+    Check if a user has a specific permission
+    Includes scope validation for team/self permissions; super admins hold
+    every permission and are not limited to own/team resources
+    """
+    if context.role == UserRole.SUPER_ADMIN:
+        return PermissionCheckResult(allowed=True)
+
+    allowed, reason = _check_permission(
+        context.role,
+        permission,
+        context.user_id,
+        context.team_id,
+        context.resource_owner_id,
+        context.resource_team_id,
+    )
+    return PermissionCheckResult(allowed=allowed, reason=reason)
+
+
+def has_permission_bulk(
+    context: PermissionContext,
+    permission: Permission,
+    resource_owner_ids: Sequence[Optional[str]],
+    resource_team_ids: Sequence[Optional[str]],
+) -> List[bool]:
+    """
+    Check one permission for one user against many resources
+    Row i is the resource owned by resource_owner_ids[i] in team
+    resource_team_ids[i]; the role and scope are resolved once, leaving only
+    an id comparison per row, e.g. for list or export endpoints
+    """
+    count = len(resource_owner_ids)
+    if len(resource_team_ids) != count:
+        raise ValueError("resource_owner_ids and resource_team_ids must be the same length")
+
+    if context.role == UserRole.SUPER_ADMIN:
+        return [True] * count
+    if not role_has_permission(context.role, permission):
+        return [False] * count
+    if permission in OWN_SCOPED_PERMISSIONS:
+        user_id = context.user_id
+        return [owner_id == user_id for owner_id in resource_owner_ids]
+    if permission in TEAM_SCOPED_PERMISSIONS:
+        team_id = context.team_id
+        return [resource_team_id == team_id for resource_team_id in resource_team_ids]
+    return [True] * count
 
 
 def has_any_permission(
@@ -95,33 +188,17 @@ def has_any_role(user_role: UserRole, required_roles: List[UserRole]) -> bool:
 
 def is_role_higher_than(role: UserRole, compare_role: UserRole) -> bool:
     """Check if a role is higher in hierarchy than another role"""
-    hierarchy = {
-        UserRole.SUPER_ADMIN: 5,
-        UserRole.ADMIN: 4,
-        UserRole.MANAGER: 3,
-        UserRole.STAFF: 2,
-        UserRole.VIEWER: 1,
-    }
-
-    return hierarchy.get(role, 0) > hierarchy.get(compare_role, 0)
+    return _ROLE_HIERARCHY.get(role, 0) > _ROLE_HIERARCHY.get(compare_role, 0)
 
 
-def get_permissions_for_role(role: UserRole) -> List[Permission]:
+def get_permissions_for_role(role: UserRole) -> Tuple[Permission, ...]:
     """Get all permissions for a role"""
-    return ROLE_PERMISSIONS.get(role, [])
+    return ROLE_PERMISSIONS.get(role, ())
 
 
 def get_role_display_name(role: UserRole) -> str:
     """Get role display name"""
-    display_names = {
-        UserRole.SUPER_ADMIN: "Super Admin",
-        UserRole.ADMIN: "Admin",
-        UserRole.MANAGER: "Manager",
-        UserRole.STAFF: "Staff",
-        UserRole.VIEWER: "Viewer",
-    }
-
-    return display_names.get(role, str(role))
+    return _ROLE_DISPLAY_NAMES.get(role, str(role))
 
 
 def can_assign_role(user_role: UserRole, target_role: UserRole) -> bool:
@@ -135,7 +212,7 @@ def can_assign_role(user_role: UserRole, target_role: UserRole) -> bool:
 
     # Admins can assign manager, staff, viewer
     if user_role == UserRole.ADMIN:
-        return target_role in [UserRole.MANAGER, UserRole.STAFF, UserRole.VIEWER]
+        return target_role in _ADMIN_ASSIGNABLE_ROLE_SET
 
     # Other roles cannot assign roles
     return False
@@ -143,10 +220,11 @@ def can_assign_role(user_role: UserRole, target_role: UserRole) -> bool:
 
 def get_assignable_roles(user_role: UserRole) -> List[UserRole]:
     """Filter available roles based on user's role"""
+    # Copies, so callers can't mutate the shared tuples
     if user_role == UserRole.SUPER_ADMIN:
-        return list(UserRole)
+        return list(_ALL_ROLES)
 
     if user_role == UserRole.ADMIN:
-        return [UserRole.MANAGER, UserRole.STAFF, UserRole.VIEWER]
+        return list(_ADMIN_ASSIGNABLE_ROLES)
 
     return []
@@ -2,6 +2,7 @@
 
 from python.websocket.types import (
     WSEventType,
+    EVENT_TYPE_VALUE,
     WSChannel,
     WebSocketMessage,
     ConnectionEstablishedPayload,
@@ -43,10 +44,12 @@ from python.websocket.types import (
     SystemMaintenancePayload,
     ErrorPayload,
     create_ws_message,
+    create_ws_message_bytes,
 )
 
 __all__ = [
     "WSEventType",
+    "EVENT_TYPE_VALUE",
     "WSChannel",
     "WebSocketMessage",
     "ConnectionEstablishedPayload",
@@ -88,4 +91,5 @@ __all__ = [
     "SystemMaintenancePayload",
     "ErrorPayload",
     "create_ws_message",
+    "create_ws_message_bytes",
 ]
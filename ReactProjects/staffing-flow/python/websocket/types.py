@@ -1,10 +1,30 @@
 """WebSocket Event Types and Payloads for Python Backend"""
 
+import time
 from enum import Enum
 from typing import Any, Dict, List, Optional, Union
-from datetime import datetime
+from datetime import datetime, timezone
+import orjson
 from pydantic import BaseModel, Field
 
+# Messages stamped within this many seconds of each other share one timestamp
+TIMESTAMP_RESOLUTION_SECONDS = 0.05
+
+_ts_cache: tuple[float, str] = (0.0, "")
+
+
+def _now_iso() -> str:
+    """Current UTC time as a naive ISO string, reformatted at most every 50 ms"""
+    global _ts_cache
+    now = time.time()
+    cached_at, formatted = _ts_cache
+    # A backwards clock step makes the difference negative; reformat then too
+    if 0 <= now - cached_at < TIMESTAMP_RESOLUTION_SECONDS:
+        return formatted
+    formatted = datetime.fromtimestamp(now, timezone.utc).replace(tzinfo=None).isoformat()
+    _ts_cache = (now, formatted)
+    return formatted
+
 
 class WSEventType(str, Enum):
     """WebSocket event types"""
@@ -58,6 +78,11 @@ class WSEventType(str, Enum):
     ERROR = "error"
 
 
+# Wire string per event type, read without an enum attribute lookup. WSEventType
+# members hash and compare like their strings, so plain strings resolve too
+EVENT_TYPE_VALUE: Dict[str, str] = {event_type: event_type.value for event_type in WSEventType}
+
+
 class WSChannel:
     """WebSocket channel patterns"""
 
@@ -96,11 +121,34 @@ class WebSocketMessage(BaseModel):
 
     type: str
     payload: Dict[str, Any]
-    timestamp: str = Field(default_factory=lambda: datetime.utcnow().isoformat())
+    timestamp: str = Field(default_factory=_now_iso)
     id: str
     user_id: Optional[str] = None
     organization_id: Optional[str] = None
 
+    @classmethod
+    def outgoing(
+        cls,
+        event_type: Union[WSEventType, str],
+        payload: BaseModel,
+        message_id: str,
+        user_id: Optional[str] = None,
+        organization_id: Optional[str] = None,
+    ) -> "WebSocketMessage":
+        """
+        Build a server-originated message without validation
+        Every field comes from a validated payload model or server code, so
+        validation only runs on ingress, when parsing what clients send
+        """
+        return cls.model_construct(
+            type=EVENT_TYPE_VALUE[event_type],
+            payload=payload.model_dump(mode="json"),
+            timestamp=_now_iso(),
+            id=message_id,
+            user_id=user_id,
+            organization_id=organization_id,
+        )
+
 
 # Connection Events
 class ConnectionEstablishedPayload(BaseModel):
@@ -372,18 +420,39 @@ class ErrorPayload(BaseModel):
 
 # Helper function to create WebSocket message
 def create_ws_message(
-    event_type: WSEventType,
+    event_type: Union[WSEventType, str],
     payload: BaseModel,
     message_id: str,
     user_id: Optional[str] = None,
     organization_id: Optional[str] = None,
 ) -> Dict[str, Any]:
-    """Create a WebSocket message with proper structure"""
+    """Create a WebSocket message with proper structure
+
+    The payload is dumped straight to JSON-ready values, so the dict can be
+    encoded without a default hook
+    """
     return {
-        "type": event_type.value,
-        "payload": payload.dict(),
-        "timestamp": datetime.utcnow().isoformat(),
+        "type": EVENT_TYPE_VALUE[event_type],
+        "payload": payload.model_dump(mode="json"),
+        "timestamp": _now_iso(),
         "id": message_id,
         "userId": user_id,
         "organizationId": organization_id,
     }
+
+
+def create_ws_message_bytes(
+    event_type: Union[WSEventType, str],
+    payload: BaseModel,
+    message_id: str,
+    user_id: Optional[str] = None,
+    organization_id: Optional[str] = None,
+) -> bytes:
+    """Create a WebSocket message already encoded as JSON bytes
+
+    For fan-out, encode once before the subscriber loop and send the same
+    bytes to every connection
+    """
+    return orjson.dumps(
+        create_ws_message(event_type, payload, message_id, user_id, organization_id)
+    )
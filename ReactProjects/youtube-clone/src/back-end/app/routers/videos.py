@@ -1,11 +1,14 @@
 # backend/app/routers/videos.py
 from typing import List
 import os
-import uuid
+import re
 import shutil
-from pathlib import Path
-from fastapi import APIRouter, UploadFile, File, Form, HTTPException
-from pydantic import BaseModel
+import time
+from pathlib import Path, PureWindowsPath
+from secrets import token_hex
+import anyio
+from fastapi import APIRouter, BackgroundTasks, UploadFile, File, Form, HTTPException, Response
+from pydantic import BaseModel, TypeAdapter
 
 router = APIRouter()
 
@@ -13,11 +16,72 @@ router = APIRouter()
 UPLOAD_DIR = Path(__file__).parent.parent.parent / "uploads"
 VIDEO_DIR = UPLOAD_DIR / "videos"
 THUMBNAIL_DIR = UPLOAD_DIR / "thumbnails"
+TEMP_DIR = UPLOAD_DIR / "temp"
 
 # Ensure directories exist
 VIDEO_DIR.mkdir(parents=True, exist_ok=True)
 THUMBNAIL_DIR.mkdir(parents=True, exist_ok=True)
 
+# Upper bound on chunks per upload; it also caps the received-chunk bitmap's size
+MAX_CHUNKS = 10_000
+
+# Upload ids name a temp directory, so only plain name characters are accepted
+UPLOAD_ID_PATTERN = re.compile(r"[A-Za-z0-9_-]{1,64}")
+
+
+def _safe_filename(filename: str | None, fallback: str) -> str:
+    """Strip any directory part (either slash style) from a client-supplied filename"""
+    name = PureWindowsPath(filename or "").name
+    return name if name not in ("", ".", "..") else fallback
+
+
+def _check_total_chunks(total_chunks: int) -> None:
+    """Reject chunk counts the received-chunk bitmap should not be sized for"""
+    if not 1 <= total_chunks <= MAX_CHUNKS:
+        raise HTTPException(status_code=400, detail=f"total_chunks must be between 1 and {MAX_CHUNKS}")
+
+
+def _check_upload_id(upload_id: str) -> None:
+    """Reject upload ids that could escape the temp directory"""
+    if not UPLOAD_ID_PATTERN.fullmatch(upload_id):
+        raise HTTPException(status_code=400, detail="Invalid upload_id")
+
+
+# Larger copy buffer than shutil's default means far fewer read/write calls per upload
+COPY_BUFFER_SIZE = 4 * 1024 * 1024
+
+
+def _append_chunk(chunk_path: Path, outfile) -> None:
+    """Append a chunk file to outfile, copying in-kernel with os.sendfile where possible"""
+    with chunk_path.open("rb") as infile:
+        size = os.fstat(infile.fileno()).st_size
+        offset = 0
+        # Anything buffered must reach the descriptor before sendfile writes to it
+        outfile.flush()
+        try:
+            while offset < size:
+                sent = os.sendfile(outfile.fileno(), infile.fileno(), offset, size - offset)
+                if sent == 0:
+                    break
+                offset += sent
+        except (AttributeError, OSError):
+            # No sendfile on this platform or for these files: copy the rest in user space
+            infile.seek(offset)
+            shutil.copyfileobj(infile, outfile, COPY_BUFFER_SIZE)
+
+
+def _save_upload(upload: UploadFile, path: Path) -> None:
+    """Write an uploaded file to disk (blocking; run it off the event loop)"""
+    with path.open("wb") as buffer:
+        shutil.copyfileobj(upload.file, buffer, COPY_BUFFER_SIZE)
+
+
+def _combine_chunks(temp_dir: Path, total_chunks: int, video_path: Path) -> None:
+    """Join numbered chunk files into the final video (blocking; run it off the event loop)"""
+    with video_path.open("wb") as outfile:
+        for i in range(total_chunks):
+            _append_chunk(temp_dir / f"chunk_{i}", outfile)
+
 
 class Video(BaseModel):
     id: str
@@ -48,6 +112,22 @@ fake_videos_db = [
     ),
 ]
 
+# Lookup by id for get_video; kept in step with fake_videos_db by _add_video
+fake_videos_index: dict[str, Video] = {video.id: video for video in fake_videos_db}
+
+
+# Encoded list_videos body, rebuilt on the first request after a change
+_video_list_adapter = TypeAdapter(List[Video])
+_list_cache: bytes | None = None
+
+
+def _add_video(video: Video) -> None:
+    """Store a new video in the fake database and its id index"""
+    global _list_cache
+    fake_videos_db.append(video)
+    fake_videos_index[video.id] = video
+    _list_cache = None
+
 
 @router.get("/", response_model=List[Video])
 async def list_videos():
@@ -55,15 +135,18 @@ async def list_videos():
     Simple demo endpoint: return all videos.
     Later you'll replace with real DB queries.
     """
-    return fake_videos_db
+    global _list_cache
+    if _list_cache is None:
+        _list_cache = _video_list_adapter.dump_json(fake_videos_db)
+    return Response(content=_list_cache, media_type="application/json")
 
 
 @router.get("/{video_id}", response_model=Video)
 async def get_video(video_id: str):
-    for video in fake_videos_db:
-        if video.id == video_id:
-            return video
-    raise HTTPException(status_code=404, detail="Video not found")
+    video = fake_videos_index.get(video_id)
+    if video is None:
+        raise HTTPException(status_code=404, detail="Video not found")
+    return video
 
 
 @router.post("/upload", response_model=Video)
@@ -82,23 +165,21 @@ async def upload_video(
     - thumbnail: Thumbnail image (optional)
     """
     # Generate unique ID
-    video_id = f"vid_{uuid.uuid4().hex[:8]}"
+    video_id = f"vid_{token_hex(4)}"
     
     # Save video file
-    video_filename = f"{video_id}_{video.filename}"
+    video_filename = f"{video_id}_{_safe_filename(video.filename, 'video')}"
     video_path = VIDEO_DIR / video_filename
     
-    with video_path.open("wb") as buffer:
-        shutil.copyfileobj(video.file, buffer)
+    await anyio.to_thread.run_sync(_save_upload, video, video_path)
     
     # Save thumbnail if provided
     thumbnail_filename = None
     if thumbnail:
-        thumbnail_filename = f"{video_id}_{thumbnail.filename}"
+        thumbnail_filename = f"{video_id}_{_safe_filename(thumbnail.filename, 'thumbnail')}"
         thumbnail_path = THUMBNAIL_DIR / thumbnail_filename
         
-        with thumbnail_path.open("wb") as buffer:
-            shutil.copyfileobj(thumbnail.file, buffer)
+        await anyio.to_thread.run_sync(_save_upload, thumbnail, thumbnail_path)
     
     # Create video object
     new_video = Video(
@@ -112,46 +193,91 @@ async def upload_video(
     )
     
     # Add to our fake database
-    fake_videos_db.append(new_video)
+    _add_video(new_video)
     
     return new_video
 
 
-# Temporary storage for chunk uploads
-chunk_storage = {}
+# Chunks received per upload, as a bitmap with bit i set once chunk i is saved
+chunk_storage: dict[str, int] = {}
+
+# Abandoned uploads are forgotten after an idle hour, and only so many are tracked
+CHUNK_UPLOAD_TTL_SECONDS = 3600
+MAX_PENDING_UPLOADS = 1024
+
+# Last chunk time per upload, least recently active first
+_chunk_last_seen: dict[str, float] = {}
+
+
+def _touch_upload(upload_id: str, now: float) -> None:
+    """Mark an upload as just active, moving it to the back of the eviction order"""
+    _chunk_last_seen.pop(upload_id, None)
+    _chunk_last_seen[upload_id] = now
+
+
+def _forget_upload(upload_id: str) -> None:
+    """Stop tracking an upload's chunks"""
+    chunk_storage.pop(upload_id, None)
+    _chunk_last_seen.pop(upload_id, None)
+
+
+def _evict_stale_uploads(now: float) -> List[str]:
+    """Forget uploads idle past the TTL or beyond the cap; returns their ids"""
+    evicted = []
+    for upload_id, last_seen in list(_chunk_last_seen.items()):
+        if (
+            now - last_seen < CHUNK_UPLOAD_TTL_SECONDS
+            and len(_chunk_last_seen) <= MAX_PENDING_UPLOADS
+        ):
+            break
+        _forget_upload(upload_id)
+        evicted.append(upload_id)
+    return evicted
 
 @router.post("/upload-chunk")
 async def upload_chunk(
+    background_tasks: BackgroundTasks,
     chunk_index: int = Form(...),
     total_chunks: int = Form(...),
     upload_id: str = Form(...),
     chunk: UploadFile = File(...),
 ):
     """Upload a single chunk of a video file"""
+    _check_upload_id(upload_id)
+    _check_total_chunks(total_chunks)
+    if not 0 <= chunk_index < total_chunks:
+        raise HTTPException(status_code=400, detail="Chunk index out of range")
+    
     # Create temp directory for this upload
-    temp_dir = UPLOAD_DIR / "temp" / upload_id
+    temp_dir = TEMP_DIR / upload_id
     temp_dir.mkdir(parents=True, exist_ok=True)
     
     # Save chunk
     chunk_path = temp_dir / f"chunk_{chunk_index}"
-    with chunk_path.open("wb") as buffer:
-        shutil.copyfileobj(chunk.file, buffer)
+    await anyio.to_thread.run_sync(_save_upload, chunk, chunk_path)
     
-    # Track progress
-    if upload_id not in chunk_storage:
-        chunk_storage[upload_id] = set()
-    chunk_storage[upload_id].add(chunk_index)
+    # Track progress; the update runs on the event loop between awaits, so it
+    # cannot interleave with another chunk's update
+    received = chunk_storage.get(upload_id, 0) | (1 << chunk_index)
+    chunk_storage[upload_id] = received
+    now = time.monotonic()
+    _touch_upload(upload_id, now)
+    
+    # Sweep abandoned uploads and their chunk files after responding
+    for stale_id in _evict_stale_uploads(now):
+        background_tasks.add_task(shutil.rmtree, TEMP_DIR / stale_id, ignore_errors=True)
     
     return {
         "chunk_index": chunk_index,
         "total_chunks": total_chunks,
-        "received": len(chunk_storage[upload_id]),
-        "complete": len(chunk_storage[upload_id]) == total_chunks
+        "received": received.bit_count(),
+        "complete": received == (1 << total_chunks) - 1
     }
 
 
 @router.post("/finalize-upload", response_model=Video)
 async def finalize_upload(
+    background_tasks: BackgroundTasks,
     upload_id: str = Form(...),
     title: str = Form(...),
     description: str = Form(None),
@@ -160,35 +286,45 @@ async def finalize_upload(
     thumbnail: UploadFile = File(None),
 ):
     """Combine all chunks into final video file"""
-    temp_dir = UPLOAD_DIR / "temp" / upload_id
+    _check_upload_id(upload_id)
+    _check_total_chunks(total_chunks)
+    temp_dir = TEMP_DIR / upload_id
     
     # Verify all chunks received
-    if upload_id not in chunk_storage or len(chunk_storage[upload_id]) != total_chunks:
+    received = chunk_storage.get(upload_id)
+    if received != (1 << total_chunks) - 1:
         raise HTTPException(status_code=400, detail="Not all chunks received")
     
+    # Claim the upload before the first await, so a concurrent finalize for the
+    # same id fails the check above instead of combining the same chunks
+    _forget_upload(upload_id)
+    
     # Generate video ID
-    video_id = f"vid_{uuid.uuid4().hex[:8]}"
-    video_filename = f"{video_id}_{filename}"
+    video_id = f"vid_{token_hex(4)}"
+    video_filename = f"{video_id}_{_safe_filename(filename, 'video')}"
     video_path = VIDEO_DIR / video_filename
     
-    # Combine chunks
-    with video_path.open("wb") as outfile:
-        for i in range(total_chunks):
-            chunk_path = temp_dir / f"chunk_{i}"
-            with chunk_path.open("rb") as infile:
-                shutil.copyfileobj(infile, outfile)
+    # Combine chunks; on failure drop the partial file and hand the upload back
+    # so the client can retry the finalize
+    try:
+        await anyio.to_thread.run_sync(_combine_chunks, temp_dir, total_chunks, video_path)
+    except BaseException:
+        video_path.unlink(missing_ok=True)
+        chunk_storage[upload_id] = received
+        _touch_upload(upload_id, time.monotonic())
+        raise
     
-    # Clean up temp files
-    shutil.rmtree(temp_dir)
-    del chunk_storage[upload_id]
+    # Clean up temp files once the response is sent; the upload was claimed
+    # before the combine, so any other finalize for it, concurrent or later,
+    # has already been rejected
+    background_tasks.add_task(shutil.rmtree, temp_dir, ignore_errors=True)
     
     # Save thumbnail if provided
     thumbnail_filename = None
     if thumbnail:
-        thumbnail_filename = f"{video_id}_{thumbnail.filename}"
+        thumbnail_filename = f"{video_id}_{_safe_filename(thumbnail.filename, 'thumbnail')}"
         thumbnail_path = THUMBNAIL_DIR / thumbnail_filename
-        with thumbnail_path.open("wb") as buffer:
-            shutil.copyfileobj(thumbnail.file, buffer)
+        await anyio.to_thread.run_sync(_save_upload, thumbnail, thumbnail_path)
     
     # Create video object
     new_video = Video(
@@ -201,5 +337,5 @@ async def finalize_upload(
         duration=0,
     )
     
-    fake_videos_db.append(new_video)
+    _add_video(new_video)
     return new_video